@@ -0,0 +1,218 @@
+"""Columnar entity batches and vectorised filtering."""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from .filters import (
+    EntityList,
+    FilterConfig,
+    _fuzzy_predicate,
+    _partial_word_predicate,
+    _regex_predicate,
+)
+
+
+def _encode(values: List[str]) -> Tuple[List[str], np.ndarray]:
+    """Dictionary-encode a column of strings.
+
+    Args:
+        values: Column values, one per mention
+
+    Returns:
+        Tuple of (distinct values in first-seen order, code per mention)
+    """
+    index = {value: code for code, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(
+        map(index.__getitem__, values), dtype=np.int64, count=len(values)
+    )
+    return list(index), codes
+
+@dataclass
+class EntityBatch:
+    """Column-oriented view of a list of entity records.
+
+    Entity texts and labels are dictionary-encoded so that per-text work
+    (lowercasing, set lookups, regex and fuzzy matching) is done once per
+    distinct string and then broadcast to all mentions with NumPy indexing.
+
+    Attributes:
+        records: The original entity records, in input order
+        objects: The records as a NumPy object array, for selection by mask
+        texts: Distinct entity texts
+        texts_lower: Lowercased distinct entity texts
+        text_codes: Index into ``texts`` for every mention
+        labels: Distinct entity labels
+        label_codes: Index into ``labels`` for every mention
+        lengths: Text length of every mention
+    """
+    records: EntityList
+    objects: np.ndarray
+    texts: List[str]
+    texts_lower: List[str]
+    text_codes: np.ndarray
+    labels: List[str]
+    label_codes: np.ndarray
+    lengths: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: EntityList) -> "EntityBatch":
+        """Build a columnar batch from entity records.
+
+        The columns are built with C-level ``map`` calls rather than a Python
+        loop per mention, but still cost about as much as one ``filter_all``
+        pass, so build a batch once and reuse it for every filter pass.
+
+        Args:
+            records: List of EntityRecord instances
+
+        Returns:
+            EntityBatch with encoded text and label columns
+        """
+        texts, text_codes = _encode(list(map(attrgetter("text"), records)))
+        labels, label_codes = _encode(list(map(attrgetter("label"), records)))
+        text_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        return cls(
+            records=records,
+            objects=np.fromiter(records, dtype=object, count=len(records)),
+            texts=texts,
+            texts_lower=[text.lower() for text in texts],
+            text_codes=text_codes,
+            labels=labels,
+            label_codes=label_codes,
+            lengths=text_lengths[text_codes]
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def select(self, mask: np.ndarray) -> EntityList:
+        """Return the records selected by a boolean mask.
+
+        Args:
+            mask: Boolean array with one entry per mention
+
+        Returns:
+            Selected entity records, in input order
+        """
+        return self.objects[mask].tolist()
+
+def _apply_text_predicate(
+    batch: EntityBatch,
+    mask: np.ndarray,
+    predicate: Callable[[int], bool]
+) -> np.ndarray:
+    """Evaluate a predicate once per distinct text still in the mask.
+
+    Args:
+        batch: Columnar entity batch
+        mask: Current mention mask
+        predicate: Callable taking a distinct text index
+
+    Returns:
+        Mention mask narrowed by the predicate
+    """
+    distinct = np.zeros(len(batch.texts), dtype=bool)
+    distinct[batch.text_codes[mask]] = True
+    live = np.flatnonzero(distinct)
+    distinct[live] = np.fromiter(
+        (predicate(i) for i in live.tolist()),
+        dtype=bool,
+        count=len(live)
+    )
+    return mask & distinct[batch.text_codes]
+
+def batch_mask(
+    batch: EntityBatch,
+    config: FilterConfig
+) -> np.ndarray:
+    """Compute the mask of mentions that pass all configured filters.
+
+    Type and length filters are evaluated as array comparisons; text based
+    filters are evaluated once per distinct entity text, and fuzzy, regex and
+    partial word results are shared across batches through ``config.memo``.
+
+    Args:
+        batch: Columnar entity batch
+        config: Filter configuration
+
+    Returns:
+        Boolean array with one entry per mention
+    """
+    mask = np.ones(len(batch), dtype=bool)
+
+    if config.entity_types:
+        allowed = [
+            code for code, label in enumerate(batch.labels)
+            if label in config.entity_types
+        ]
+        mask &= np.isin(batch.label_codes, allowed)
+
+    if config.min_length is not None:
+        mask &= batch.lengths >= config.min_length
+
+    if config.max_length is not None:
+        mask &= batch.lengths <= config.max_length
+
+    lower = batch.texts_lower
+
+    if config.blacklist:
+        blacklist_lower = {word.lower() for word in config.blacklist}
+        mask = _apply_text_predicate(
+            batch, mask, lambda i: lower[i] not in blacklist_lower
+        )
+
+    if config.whitelist:
+        whitelist_lower = {word.lower() for word in config.whitelist}
+        mask = _apply_text_predicate(
+            batch, mask, lambda i: lower[i] in whitelist_lower
+        )
+
+    texts = batch.texts
+
+    if config.fuzzy_match:
+        matches = _fuzzy_predicate(
+            config.fuzzy_match,
+            config.fuzzy_threshold,
+            config.memo
+        )
+        mask = _apply_text_predicate(batch, mask, lambda i: matches(texts[i]))
+
+    if config.regex_pattern:
+        regex_matches = _regex_predicate(config.regex_pattern, config.memo)
+        if regex_matches is not None:  # Invalid regex keeps all entities
+            mask = _apply_text_predicate(
+                batch, mask, lambda i: regex_matches(texts[i])
+            )
+
+    if config.partial_word:
+        word_matches = _partial_word_predicate(config.partial_word, config.memo)
+        mask = _apply_text_predicate(
+            batch, mask, lambda i: word_matches(texts[i])
+        )
+
+    return mask
+
+def filter_batch(
+    entities: EntityList,
+    config: FilterConfig
+) -> EntityList:
+    """Apply all configured filters using the columnar batch path.
+
+    Produces the same result as ``filter_all``. Building the batch costs
+    about one ``filter_all`` pass, so this only pays off for large batches
+    with expensive text filters (fuzzy, regex) over repeated texts; to run
+    several filter passes, build an ``EntityBatch`` once and call
+    ``batch_mask`` for each.
+
+    Args:
+        entities: List of EntityRecord instances
+        config: Filter configuration
+
+    Returns:
+        Filtered list of entities that match all configured filter criteria
+    """
+    batch = EntityBatch.from_records(entities)
+    return batch.select(batch_mask(batch, config))
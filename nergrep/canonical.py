@@ -0,0 +1,209 @@
+"""Resolution of entity surface forms to canonical IDs."""
+
+import csv
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz, process
+
+from .filters import TextMemo
+from .types import EntityRecord
+
+# Characters dropped when normalizing surface forms
+PUNCTUATION = re.compile(r"[^\w\s]")
+WHITESPACE = re.compile(r"\s+")
+
+# Length of the token prefixes aliases are blocked on for fuzzy matching
+PREFIX_CHARS = 3
+
+# Blocking keys shared by more aliases than this (e.g. "inc") are too
+# common to narrow the fuzzy candidates, and are ignored
+MAX_BLOCK_SIZE = 1000
+
+
+def normalize(text: str) -> str:
+    """Normalize a surface form for lookup.
+
+    Case-folds, replaces punctuation with spaces and collapses whitespace,
+    so that e.g. ``Apple Inc.`` and ``apple  inc`` share a key.
+
+    Args:
+        text: Surface form to normalize
+
+    Returns:
+        Normalized lookup key
+    """
+    text = PUNCTUATION.sub(" ", text.casefold())
+    return WHITESPACE.sub(" ", text).strip()
+
+def _blocking_keys(key: str) -> Set[str]:
+    """Return the tokens and token prefixes of a normalized alias."""
+    tokens = key.split()
+    return set(tokens) | {"^" + token[:PREFIX_CHARS] for token in tokens}
+
+def read_aliases(path: str) -> List[Tuple[str, str]]:
+    """Read an alias table.
+
+    The table has one ``alias<TAB>canonical_id`` row per line, or
+    comma-separated columns if the file name ends in ``.csv``. Empty rows
+    and rows starting with ``#`` are skipped.
+
+    Args:
+        path: Path to the alias table
+
+    Returns:
+        List of (alias, canonical ID) pairs in file order
+
+    Raises:
+        ValueError: If a row does not have two columns
+    """
+    delimiter = "," if path.lower().endswith(".csv") else "\t"
+    aliases = []
+    with Path(path).open(encoding="utf-8", newline="") as table:
+        for number, row in enumerate(csv.reader(table, delimiter=delimiter), 1):
+            if not row or not "".join(row).strip() or row[0].startswith("#"):
+                continue
+            if len(row) != 2:
+                raise ValueError(
+                    f"{path}:{number}: expected alias and canonical ID, "
+                    f"got {len(row)} columns"
+                )
+            aliases.append((row[0].strip(), row[1].strip()))
+    return aliases
+
+class CanonicalIndex:
+    """Lookup of canonical IDs for entity surface forms.
+
+    Surface forms are resolved by exact alias, then by normalized alias (see
+    ``normalize``), then, if ``threshold`` is set, by the most similar
+    normalized alias scoring at least ``threshold``. When aliases collide,
+    the first one in the table wins. Resolutions are memoized per surface
+    form, so each distinct string is looked up once.
+
+    Fuzzy matching only scores aliases that share a token, or a token's
+    first ``PREFIX_CHARS`` characters, with the surface form and whose
+    length allows a score above ``threshold``. Aliases are indexed by these
+    blocking keys when the index is built, so a lookup scores a handful of
+    candidates instead of the whole table.
+
+    Attributes:
+        exact: Canonical ID per alias
+        normalized: Canonical ID per normalized alias
+        threshold: Minimum fuzzy similarity (0-100), or None for no fuzzy
+            fallback
+        memo: LRU memo of resolved surface forms
+    """
+
+    def __init__(
+        self,
+        aliases: Iterable[Tuple[str, str]],
+        threshold: Optional[float] = 90.0,
+        memo_size: int = 65536
+    ):
+        """Build the index.
+
+        Args:
+            aliases: (alias, canonical ID) pairs
+            threshold: Minimum fuzzy similarity, or None to disable fuzzy
+                matching
+            memo_size: Maximum number of memoized resolutions
+        """
+        self.exact: Dict[str, str] = {}
+        self.normalized: Dict[str, str] = {}
+        for alias, canonical_id in aliases:
+            self.exact.setdefault(alias, canonical_id)
+            key = normalize(alias)
+            if key:
+                self.normalized.setdefault(key, canonical_id)
+        self.threshold = threshold
+        self.memo = TextMemo(memo_size)
+        self._keys = list(self.normalized)
+        self._blocks: Dict[str, List[int]] = {}
+        if threshold is not None:
+            for index, key in enumerate(self._keys):
+                for block in _blocking_keys(key):
+                    self._blocks.setdefault(block, []).append(index)
+        self._resolve = self.memo.wrap(("canonical", threshold), self._lookup)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        threshold: Optional[float] = 90.0,
+        memo_size: int = 65536
+    ) -> "CanonicalIndex":
+        """Build an index from an alias table file, see ``read_aliases``.
+
+        Args:
+            path: Path to the alias table
+            threshold: Minimum fuzzy similarity, or None to disable fuzzy
+                matching
+            memo_size: Maximum number of memoized resolutions
+
+        Returns:
+            The index
+
+        Raises:
+            ValueError: If the table is malformed
+        """
+        return cls(read_aliases(path), threshold, memo_size)
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def resolve(self, text: str) -> Optional[str]:
+        """Return the canonical ID of a surface form.
+
+        Args:
+            text: Entity text
+
+        Returns:
+            The canonical ID, or None if the text matches no alias
+        """
+        return self._resolve(text)
+
+    def canonicalize(self, entities: Iterable[EntityRecord]) -> None:
+        """Set ``canonical_id`` on entity records in place.
+
+        Args:
+            entities: Entity records to update
+        """
+        for entity in entities:
+            entity.canonical_id = self._resolve(entity.text)
+
+    def _lookup(self, text: str) -> Optional[str]:
+        """Resolve a surface form without the memo."""
+        if text in self.exact:
+            return self.exact[text]
+        key = normalize(text)
+        if key in self.normalized:
+            return self.normalized[key]
+        if self.threshold is None or not key:
+            return None
+        match = process.extractOne(
+            key,
+            self._candidates(key),
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=self.threshold
+        )
+        return self.normalized[match[0]] if match is not None else None
+
+    def _candidates(self, key: str) -> List[str]:
+        """Return the normalized aliases worth scoring against a key."""
+        indexes: Set[int] = set()
+        for block in _blocking_keys(key):
+            members = self._blocks.get(block, ())
+            if len(members) <= MAX_BLOCK_SIZE:
+                indexes.update(members)
+
+        # fuzz.ratio is at most 200 * shorter / (shorter + longer)
+        threshold = min(max(self.threshold, 0.0), 100.0)
+        min_length = len(key) * threshold / (200 - threshold)
+        max_length = len(key) * (200 - threshold) / max(threshold, 1.0)
+        # Table order, so the first of equally similar aliases wins
+        return [
+            self._keys[index] for index in sorted(indexes)
+            if min_length <= len(self._keys[index]) <= max_length
+        ]
@@ -0,0 +1,89 @@
+"""Checkpointing of long-running extraction jobs."""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from .documents import Cursor, Document
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a job whose output has been durably written.
+
+    Inputs are read in a deterministic order (directories in sorted order),
+    so progress is a single cursor per input argument rather than a list of
+    every finished file, and a checkpoint stays the same size however many
+    files a job reads.
+
+    Attributes:
+        inputs: Input arguments of the job, to detect mismatched resumes
+        output_bytes: Size of the output file covered by this checkpoint
+        documents: Number of documents fully written
+        cursors: Progress per input argument index: the last file (or
+            literal text key) written and, for line-delimited files, the
+            byte offset and line number at which to resume
+    """
+    inputs: List[str] = field(default_factory=list)
+    output_bytes: int = 0
+    documents: int = 0
+    cursors: Dict[int, Cursor] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """Load a checkpoint, or return an empty one if none exists.
+
+        Args:
+            path: Path to the checkpoint file
+
+        Returns:
+            The stored checkpoint
+        """
+        checkpoint_path = Path(path)
+        if not checkpoint_path.exists():
+            return cls()
+        data = json.loads(checkpoint_path.read_text())
+        return cls(
+            inputs=data["inputs"],
+            output_bytes=data["output_bytes"],
+            documents=data["documents"],
+            cursors={
+                int(index): (key, offset, line)
+                for index, (key, offset, line) in data["cursors"].items()
+            }
+        )
+
+    def save(self, path: str) -> None:
+        """Atomically write the checkpoint.
+
+        The checkpoint is written to a temporary file and renamed over the
+        previous one, so a crash never leaves a partial checkpoint behind.
+
+        Args:
+            path: Path to the checkpoint file
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({
+                "inputs": self.inputs,
+                "output_bytes": self.output_bytes,
+                "documents": self.documents,
+                "cursors": {
+                    str(index): list(cursor)
+                    for index, cursor in sorted(self.cursors.items())
+                }
+            }, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, path)
+
+    def record(self, document: Document) -> None:
+        """Mark a document as fully written.
+
+        Args:
+            document: The document whose output has been written
+        """
+        self.documents += 1
+        self.cursors[document.index] = document.cursor
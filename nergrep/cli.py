@@ -1,35 +1,99 @@
 """Command-line interface for nergrep."""
 
 import json
+import os
+import sys
+import textwrap
+from collections import Counter
+from itertools import islice, tee
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
 import typer
 
-from .extractor import extract_entities
-from .filters import FilterConfig, filter_all
+from .canonical import CanonicalIndex
+from .checkpoint import Checkpoint
+from .documents import (
+    LITERAL_SOURCE,
+    as_path,
+    iter_documents,
+    parse_shard,
+    source_order,
+)
+from .extsort import DEFAULT_BUFFER_SIZE, ExternalSorter
+from .extractor import (
+    CascadeConfig,
+    CascadeStats,
+    extract_entities,
+    extract_entities_cascade,
+    extract_many,
+    extract_multilingual,
+    installed_language_models,
+    iter_entities,
+    model_pool,
+    parse_model_map,
+)
+from .filters import FilterConfig, entity_matcher, filter_all
+from .prefilter import build_prefilter
+from .scheduler import AdaptiveBatcher
 from .types import EntityRecord
 
 app = typer.Typer()
+merge_app = typer.Typer()
+
+# Kinds of per-shard output merge understands
+MERGE_KINDS = ("entities", "counts", "names")
+
+def entity_to_dict(
+    entity: EntityRecord,
+    include_sentence: bool = True
+) -> Dict[str, Any]:
+    """Convert an entity record to a JSON-serializable dictionary.
+
+    Args:
+        entity: The entity record to convert
+        include_sentence: Whether to include the sentence context
+
+    Returns:
+        Dictionary of entity fields; ``source`` and ``canonical_id`` are
+        only present when known
+    """
+    data = {
+        "text": entity.text,
+        "label": entity.label,
+        "sentence": entity.sentence if include_sentence else "",
+        "start": entity.start,
+        "end": entity.end
+    }
+    if entity.source is not None:
+        data["source"] = entity.source
+    if entity.canonical_id is not None:
+        data["canonical_id"] = entity.canonical_id
+    return data
 
 def format_entity(entity: EntityRecord, format_type: str = "text") -> str:
     """Format an entity record for output.
 
     Args:
         entity: The entity record to format
-        format_type: Output format type ("text", "json", or "csv")
+        format_type: Output format type ("text", "json", "jsonl", or "csv")
 
     Returns:
         Formatted string representation of the entity
     """
-    if format_type == "json":
-        return json.dumps({
-            "text": entity.text,
-            "label": entity.label,
-            "sentence": entity.sentence,
-            "start": entity.start,
-            "end": entity.end
-        })
+    if format_type in ("json", "jsonl"):
+        return json.dumps(entity_to_dict(entity))
     elif format_type == "csv":
         return (
             f'"{entity.text}","{entity.label}","{entity.sentence}",'
@@ -38,9 +102,108 @@ def format_entity(entity: EntityRecord, format_type: str = "text") -> str:
     else:  # text format
         return f"{entity.text} ({entity.label}) in: {entity.sentence}"
 
+def read_terms(file_path: Optional[str]) -> Optional[Set[str]]:
+    """Read a set of terms, one per line, from a file.
+
+    Args:
+        file_path: Path to the terms file
+
+    Returns:
+        Set of terms, or None if no file was given or it does not exist
+    """
+    if not file_path:
+        return None
+    path = Path(file_path)
+    if not path.exists():
+        return None
+    return set(path.read_text().splitlines())
+
+def collect_matches(
+    entities: Iterable[EntityRecord],
+    matcher: Optional[Callable[[EntityRecord], bool]] = None,
+    limit: Optional[int] = None
+) -> List[EntityRecord]:
+    """Collect matching entities, stopping as soon as ``limit`` are found.
+
+    Args:
+        entities: Lazily extracted entity records, e.g. from ``iter_entities``
+        matcher: Optional predicate matches must pass, see ``entity_matcher``
+        limit: Maximum number of matches; the rest of the document is
+            skipped once it is reached
+
+    Returns:
+        Up to ``limit`` matching entity records in document order
+    """
+    matches = entities if matcher is None else filter(matcher, entities)
+    return list(islice(matches, limit))
+
+def set_source(entities: List[EntityRecord], source: str) -> None:
+    """Record the input entities were found in, unless it was literal text.
+
+    Args:
+        entities: Entity records to update in place
+        source: Source of the document the entities were extracted from
+    """
+    if source != LITERAL_SOURCE:
+        for entity in entities:
+            entity.source = source
+
+def print_entities(
+    entities: Iterable[EntityRecord],
+    output_format: str = "text",
+    include_sentence: bool = True,
+    stream: Optional[TextIO] = None,
+    header: bool = True
+) -> None:
+    """Print entities in the requested output format.
+
+    Args:
+        entities: Entity records to print
+        output_format: Output format type ("text", "json", "jsonl", or "csv")
+        include_sentence: Whether to include the sentence context
+        stream: Stream to write to; defaults to standard output
+        header: Whether to print the CSV header line
+    """
+    stream = stream or sys.stdout
+    if output_format == "json":
+        # Write the array one element at a time, so sorted output streamed
+        # from disk is never held in memory as a whole
+        opening = "["
+        for entity in entities:
+            item = json.dumps(entity_to_dict(entity, include_sentence), indent=2)
+            stream.write(opening + "\n" + textwrap.indent(item, "  "))
+            opening = ","
+        print("[]" if opening == "[" else "\n]", file=stream)
+    elif output_format == "jsonl":
+        for entity in entities:
+            print(json.dumps(entity_to_dict(entity, include_sentence)), file=stream)
+    elif output_format == "csv":
+        if include_sentence:
+            if header:
+                print("text,label,sentence,start,end", file=stream)
+            for entity in entities:
+                print(format_entity(entity, "csv"), file=stream)
+        else:
+            if header:
+                print("text,label,start,end", file=stream)
+            for entity in entities:
+                print(
+                    f'"{entity.text}","{entity.label}",{entity.start},{entity.end}',
+                    file=stream
+                )
+    else:  # text format
+        for entity in entities:
+            if include_sentence:
+                print(format_entity(entity, "text"), file=stream)
+            else:
+                print(f"{entity.text} ({entity.label})", file=stream)
+
 @app.command()
 def main(
-    input_text: str = typer.Argument(..., help="Input text or file path to process"),
+    inputs: List[str] = typer.Argument(
+        ...,
+        help="Input texts, file paths or directories to process"
+    ),
     types: Optional[str] = typer.Option(
         None,
         "--types",
@@ -96,7 +259,7 @@ def main(
         "text",
         "--format",
         "-o",
-        help="Output format: text, json, or csv"
+        help="Output format: text, json, jsonl, or csv"
     ),
     include_sentence: bool = typer.Option(
         True,
@@ -108,36 +271,255 @@ def main(
         "--sort",
         "-s",
         help="Sort output by: text, label, position, length, or frequency"
+    ),
+    sort_buffer: int = typer.Option(
+        DEFAULT_BUFFER_SIZE,
+        "--sort-buffer",
+        min=1,
+        help="Entities held in memory by --sort before spilling to disk"
+    ),
+    files_with_matches: bool = typer.Option(
+        False,
+        "--files-with-matches",
+        "-l",
+        help="Only print the names of inputs with at least one match"
+    ),
+    count: bool = typer.Option(
+        False,
+        "--count",
+        "-c",
+        help="Only print the number of matching entities per input"
+    ),
+    max_count: Optional[int] = typer.Option(
+        None,
+        "--max-count",
+        "-m",
+        min=0,
+        help="Stop reading an input after this many matching entities"
+    ),
+    prefilter: bool = typer.Option(
+        True,
+        "--prefilter/--no-prefilter",
+        help=(
+            "Skip NER on inputs and paragraphs that cannot contain a "
+            "--whitelist, --partial or --regex match"
+        )
+    ),
+    window: Optional[int] = typer.Option(
+        None,
+        "--window",
+        min=0,
+        help=(
+            "With prefiltering, run NER only on sentences that may match "
+            "plus this many neighbouring sentences"
+        )
+    ),
+    cascade: bool = typer.Option(
+        False,
+        "--cascade",
+        help=(
+            "Parse with a fast model first and re-parse with the large model "
+            "only where escalation rules fire"
+        )
+    ),
+    fast_model: str = typer.Option(
+        "en_core_web_sm",
+        "--fast-model",
+        help="spaCy model used for the first pass of --cascade"
+    ),
+    escalate_types: Optional[str] = typer.Option(
+        None,
+        "--escalate-types",
+        help="Entity types found by the fast model that trigger escalation"
+    ),
+    escalate_documents: bool = typer.Option(
+        False,
+        "--escalate-documents",
+        help="Escalate whole documents instead of single sentences"
+    ),
+    lines: bool = typer.Option(
+        False,
+        "--lines",
+        help="Treat every line of an input file as a separate document"
+    ),
+    jsonl_field: Optional[str] = typer.Option(
+        None,
+        "--jsonl-field",
+        help="Read JSON Lines inputs, taking document text from this field"
+    ),
+    shard: Optional[str] = typer.Option(
+        None,
+        "--shard",
+        help=(
+            "Only process shard K of N (e.g. 2/8); files, or line documents "
+            "with --lines, are assigned by hashing their path relative to "
+            "the input argument"
+        )
+    ),
+    batch_tokens: Optional[int] = typer.Option(
+        None,
+        "--batch-tokens",
+        help=(
+            "Batch documents through spaCy by this initial token budget, "
+            "adapted to latency and memory (not with --cascade or --window)"
+        )
+    ),
+    max_rss: Optional[int] = typer.Option(
+        None,
+        "--max-rss",
+        help=(
+            "With --batch-tokens or --multilingual, shrink batches while RSS "
+            "exceeds this many MB"
+        )
+    ),
+    multilingual: bool = typer.Option(
+        False,
+        "--multilingual",
+        help=(
+            "Identify each document's language and parse it with that "
+            "language's spaCy model (not with --cascade)"
+        )
+    ),
+    model_map: Optional[str] = typer.Option(
+        None,
+        "--model-map",
+        help=(
+            "Models per language for --multilingual, e.g. "
+            "de=de_core_news_sm,fr=fr_core_news_sm, overriding the installed "
+            "large models"
+        )
+    ),
+    max_models: int = typer.Option(
+        2,
+        "--max-models",
+        help="Maximum number of non-default spaCy models kept loaded at once"
+    ),
+    model_idle: Optional[float] = typer.Option(
+        None,
+        "--model-idle",
+        help="Unload non-default models unused for this many seconds"
+    ),
+    canonical_file: Optional[str] = typer.Option(
+        None,
+        "--canonical",
+        help=(
+            "Alias table (alias<TAB>canonical_id, or a .csv file) used to "
+            "attach canonical IDs to entities; --sort frequency then groups "
+            "by canonical ID"
+        )
+    ),
+    canonical_threshold: float = typer.Option(
+        90.0,
+        "--canonical-threshold",
+        help=(
+            "Minimum similarity (0-100) for resolving an entity to its "
+            "closest alias; 100 disables fuzzy resolution"
+        )
+    ),
+    output_file: Optional[str] = typer.Option(
+        None,
+        "--output-file",
+        help="Write results to this file instead of standard output"
+    ),
+    checkpoint_file: Optional[str] = typer.Option(
+        None,
+        "--checkpoint",
+        help=(
+            "Periodically record progress in this file (needs --output-file, "
+            "a streaming format and no --sort)"
+        )
+    ),
+    checkpoint_every: int = typer.Option(
+        100,
+        "--checkpoint-every",
+        help="Number of documents between checkpoints"
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue from the last --checkpoint without repeating output"
     )
 ):
     """Extract named entities from text with optional filtering."""
 
-    # Handle input text or file
-    input_path = Path(input_text)
-    if input_path.exists():
-        text = input_path.read_text()
-    else:
-        text = input_text
-
-    # Read blacklist if provided
-    blacklist = None
-    if blacklist_file:
-        blacklist_path = Path(blacklist_file)
-        if blacklist_path.exists():
-            blacklist = set(blacklist_path.read_text().splitlines())
-
-    # Read whitelist if provided
-    whitelist = None
-    if whitelist_file:
-        whitelist_path = Path(whitelist_file)
-        if whitelist_path.exists():
-            whitelist = set(whitelist_path.read_text().splitlines())
-
-    # Extract entities
-    entity_types = set(types.split(",")) if types else None
-    entities = extract_entities(text, types=entity_types)
+    if files_with_matches and count:
+        raise typer.BadParameter(
+            "cannot be combined with --count", param_hint="--files-with-matches"
+        )
+
+    try:
+        shard_selector = parse_shard(shard) if shard else None
+    except ValueError as err:
+        raise typer.BadParameter(str(err), param_hint="--shard") from err
 
-    # Apply filters
+    # Sort through temporary files once more than --sort-buffer entities
+    try:
+        sorter = ExternalSorter(sort_by, sort_buffer) if sort_by else None
+    except ValueError as err:
+        raise typer.BadParameter(str(err), param_hint="--sort") from err
+
+    # Stream output per document unless it has to be sorted or wrapped
+    streaming = not sort_by and output_format != "json"
+    if checkpoint_file and not (output_file and streaming):
+        raise typer.BadParameter(
+            "requires --output-file, no --sort and a format other than json",
+            param_hint="--checkpoint"
+        )
+    if resume and not checkpoint_file:
+        raise typer.BadParameter("requires --checkpoint", param_hint="--resume")
+    if multilingual and cascade:
+        raise typer.BadParameter(
+            "cannot be combined with --cascade", param_hint="--multilingual"
+        )
+    # Batched extraction parses whole documents, so only prefilters per
+    # document and cannot escalate per sentence
+    if batch_tokens and cascade:
+        raise typer.BadParameter(
+            "cannot be combined with --cascade", param_hint="--batch-tokens"
+        )
+    if (batch_tokens or multilingual) and window is not None:
+        raise typer.BadParameter(
+            "cannot be combined with --batch-tokens or --multilingual",
+            param_hint="--window"
+        )
+
+    # --model-map entries override the installed default models
+    language_models = installed_language_models() if multilingual else {}
+    try:
+        language_models.update(parse_model_map(model_map) if model_map else {})
+    except ValueError as err:
+        raise typer.BadParameter(str(err), param_hint="--model-map") from err
+    if max_models < 1:
+        raise typer.BadParameter("must be at least 1", param_hint="--max-models")
+
+    # Resolve surface forms to canonical IDs once per distinct text
+    canonical_index = None
+    if canonical_file:
+        try:
+            canonical_index = CanonicalIndex.load(
+                canonical_file, canonical_threshold
+            )
+        except (OSError, ValueError) as err:
+            raise typer.BadParameter(str(err), param_hint="--canonical") from err
+    model_pool.max_models = max_models
+    model_pool.max_idle = model_idle
+
+    checkpoint = Checkpoint(inputs=list(inputs))
+    if resume:
+        checkpoint = Checkpoint.load(checkpoint_file)
+        if checkpoint.inputs and checkpoint.inputs != list(inputs):
+            raise typer.BadParameter(
+                "checkpoint was written for different inputs",
+                param_hint="--resume"
+            )
+        checkpoint.inputs = list(inputs)
+
+    # Read blacklist and whitelist if provided
+    blacklist = read_terms(blacklist_file)
+    whitelist = read_terms(whitelist_file)
+
+    entity_types = set(types.split(",")) if types else None
+    filter_config = None
     if any([blacklist, whitelist, fuzzy, regex, partial_word, min_length, max_length]):
         filter_config = FilterConfig(
             entity_types=entity_types,
@@ -150,56 +532,386 @@ def main(
             min_length=min_length,
             max_length=max_length
         )
-        entities = filter_all(entities, filter_config)
-
-    # Sort entities if requested
-    if sort_by:
-        if sort_by == "text":
-            entities.sort(key=lambda x: x.text.lower())
-        elif sort_by == "label":
-            entities.sort(key=lambda x: (x.label, x.text.lower()))
-        elif sort_by == "position":
-            entities.sort(key=lambda x: x.start)
-        elif sort_by == "length":
-            entities.sort(key=lambda x: len(x.text))
-        elif sort_by == "frequency":
-            # Count entity occurrences
-            entity_counts = {}
-            for entity in entities:
-                key = (entity.text, entity.label)
-                entity_counts[key] = entity_counts.get(key, 0) + 1
-            # Sort by frequency (descending) and then by text
-            entities.sort(
-                key=lambda x: (
-                    -entity_counts[(x.text, x.label)],
-                    x.text.lower()
+    # Early-exit modes test entities one at a time
+    matcher = entity_matcher(filter_config) if filter_config else None
+
+    # Cheap lexical test run on raw text before the NER model
+    lexical_prefilter = build_prefilter(filter_config)
+    candidate = None
+    if prefilter and lexical_prefilter is not None:
+        candidate = lexical_prefilter.matches
+    # Sentence windows are chosen by the candidate test, so need one
+    if candidate is None:
+        window = None
+
+    # Escalate from the fast to the large model on uncertain labels, the
+    # requested entity types, or a lexical candidate hit
+    cascade_config = None
+    cascade_stats = CascadeStats()
+    if cascade:
+        cascade_config = CascadeConfig(
+            fast_model=fast_model,
+            escalate_types=set(escalate_types.split(",")) if escalate_types else set(),
+            candidate=lexical_prefilter.matches if lexical_prefilter else None,
+            per_sentence=not escalate_documents
+        )
+
+    # Prefix per-input results with the input name when there are several
+    multiple_inputs = len(inputs) > 1 or lines or jsonl_field is not None or any(
+        path is not None and path.is_dir() for path in map(as_path, inputs)
+    )
+
+    documents = iter_documents(
+        inputs,
+        lines=lines,
+        jsonl_field=jsonl_field,
+        shard=shard_selector,
+        cursors=checkpoint.cursors
+    )
+
+    # Length-bucketed adaptive batching parses whole documents; it is used
+    # for multilingual runs and with --batch-tokens. Otherwise prefiltered,
+    # cascaded and early-exit modes parse lazily
+    extracted = None
+    early_exit = files_with_matches or count or max_count is not None
+    batcher = AdaptiveBatcher(max_rss=max_rss * 1024 * 1024 if max_rss else None)
+    if batch_tokens:
+        batcher.token_budget = batch_tokens
+    language_counts: Counter = Counter()
+    if multilingual or batch_tokens:
+        # Documents the prefilter rejects are skipped before extraction
+        documents, batch_documents = tee(documents)
+        texts = (
+            document.text for document in batch_documents
+            if candidate is None or candidate(document.text)
+        )
+        if multilingual:
+            extracted = extract_multilingual(
+                texts,
+                entity_types,
+                batcher,
+                language_models,
+                languages=language_counts
+            )
+        else:
+            extracted = extract_many(texts, entity_types, batcher)
+
+    if output_file is None:
+        out = sys.stdout
+    else:
+        if resume and Path(output_file).exists():
+            # Drop anything written after the last checkpoint
+            os.truncate(output_file, checkpoint.output_bytes)
+        out = open(output_file, "a" if resume else "w", encoding="utf-8")
+
+    try:
+        # Only print the CSV header at the start of the output
+        header = checkpoint.output_bytes == 0
+        entities = []
+        unsaved = 0
+        for document in documents:
+            document_entities = []
+            if candidate is not None and not candidate(document.text):
+                # Nothing in this input can match, so skip the NER model
+                if count:
+                    print(f"{document.source}:0" if multiple_inputs else 0, file=out)
+            elif early_exit:
+                # Early-exit modes extract lazily and stop once the limit is hit
+                limit = 1 if files_with_matches else max_count
+                if extracted is not None:
+                    lazy_entities = iter(next(extracted))
+                else:
+                    lazy_entities = iter_entities(
+                        document.text,
+                        types=entity_types,
+                        candidate=candidate,
+                        window=window,
+                        cascade=cascade_config,
+                        stats=cascade_stats
+                    )
+                matches = collect_matches(lazy_entities, matcher, limit)
+                set_source(matches, document.source)
+                if files_with_matches:
+                    if matches:
+                        print(document.source, file=out)
+                elif count:
+                    if multiple_inputs:
+                        print(f"{document.source}:{len(matches)}", file=out)
+                    else:
+                        print(len(matches), file=out)
+                else:
+                    document_entities = matches
+            else:
+                # Extract entities, parsing only candidate paragraphs (or
+                # sentence windows) if prefiltering
+                if extracted is not None:
+                    document_entities = next(extracted)
+                elif candidate is not None:
+                    document_entities = list(iter_entities(
+                        document.text,
+                        types=entity_types,
+                        candidate=candidate,
+                        window=window,
+                        cascade=cascade_config,
+                        stats=cascade_stats
+                    ))
+                elif cascade_config is not None:
+                    document_entities = extract_entities_cascade(
+                        document.text, entity_types, cascade_config, cascade_stats
+                    )
+                else:
+                    document_entities = extract_entities(
+                        document.text, types=entity_types
+                    )
+
+                # Apply filters
+                if filter_config is not None:
+                    document_entities = filter_all(document_entities, filter_config)
+                set_source(document_entities, document.source)
+
+            if canonical_index is not None:
+                canonical_index.canonicalize(document_entities)
+
+            if streaming and not (files_with_matches or count):
+                print_entities(
+                    document_entities, output_format, include_sentence, out, header
                 )
+                header = False
+            elif sorter is not None:
+                sorter.add(document_entities)
+            else:
+                entities.extend(document_entities)
+
+            checkpoint.record(document)
+            unsaved += 1
+            if checkpoint_file and unsaved >= checkpoint_every:
+                save_checkpoint(checkpoint, checkpoint_file, out)
+                unsaved = 0
+
+        if not (streaming or files_with_matches or count):
+            # Output results, sorted if requested
+            print_entities(
+                sorter if sorter is not None else entities,
+                output_format,
+                include_sentence,
+                out
             )
 
-    # Output results
-    if output_format == "json":
-        print(json.dumps([{
-            "text": e.text,
-            "label": e.label,
-            "sentence": e.sentence if include_sentence else "",
-            "start": e.start,
-            "end": e.end
-        } for e in entities], indent=2))
-    elif output_format == "csv":
-        if include_sentence:
-            print("text,label,sentence,start,end")
-            for entity in entities:
-                print(format_entity(entity, "csv"))
+        if checkpoint_file:
+            save_checkpoint(checkpoint, checkpoint_file, out)
+    finally:
+        if sorter is not None:
+            sorter.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if cascade_config is not None:
+        # With prefiltering, whole-text escalation runs per candidate
+        # paragraph or sentence window rather than per document
+        unit = "sentences"
+        if escalate_documents:
+            unit = "documents" if candidate is None else "candidate chunks"
+        typer.echo(
+            f"Escalated {cascade_stats.escalated} of {cascade_stats.units} "
+            f"{unit} ({cascade_stats.escalation_rate:.1%})",
+            err=True
+        )
+    if multilingual:
+        typer.echo(
+            "Languages: " + ", ".join(
+                f"{language}={n}" for language, n in language_counts.most_common()
+            ),
+            err=True
+        )
+
+def save_checkpoint(checkpoint: Checkpoint, path: str, out: TextIO) -> None:
+    """Make the output durable and record it in a checkpoint.
+
+    Args:
+        checkpoint: Progress to save
+        path: Path to the checkpoint file
+        out: Output file the checkpoint covers
+    """
+    out.flush()
+    os.fsync(out.fileno())
+    checkpoint.output_bytes = out.tell()
+    checkpoint.save(path)
+
+def read_entities(file_path: str) -> Iterator[EntityRecord]:
+    """Read entity records from a JSON or JSON Lines output file.
+
+    Args:
+        file_path: Path to a file written with ``--format json`` or ``jsonl``
+
+    Yields:
+        Entity records in file order
+
+    Raises:
+        ValueError: If a record is not valid JSON or not an entity
+    """
+    with open(file_path, encoding="utf-8") as lines:
+        first = lines.read(1)
+        while first.isspace():
+            first = lines.read(1)
+        lines.seek(0)
+        if first == "[":
+            # JSON arrays are loaded whole; prefer jsonl for large outputs
+            try:
+                array = json.load(lines)
+            except json.JSONDecodeError as err:
+                raise ValueError(f"{file_path}:{err.lineno}: {err.msg}") from err
+            records = (
+                (f"{file_path}: record {number}", data)
+                for number, data in enumerate(array, 1)
+            )
         else:
-            print("text,label,start,end")
-            for entity in entities:
-                print(f'"{entity.text}","{entity.label}",{entity.start},{entity.end}')
-    else:  # text format
-        for entity in entities:
-            if include_sentence:
-                print(format_entity(entity, "text"))
-            else:
-                print(f"{entity.text} ({entity.label})")
+            records = (
+                (f"{file_path}:{number}", data)
+                for number, data in read_json_lines(file_path, lines)
+            )
+        for location, data in records:
+            try:
+                yield EntityRecord(**data)
+            except TypeError as err:
+                raise ValueError(f"{location}: not an entity record") from err
+
+def read_json_lines(
+    file_path: str,
+    lines: Iterable[str]
+) -> Iterator[Tuple[int, Any]]:
+    """Parse the non-empty lines of a JSON Lines file.
+
+    Args:
+        file_path: Path of the file, for error messages
+        lines: Lines of the file
+
+    Yields:
+        Tuples of (line number, parsed value)
+
+    Raises:
+        ValueError: If a line is not valid JSON
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError as err:
+            raise ValueError(f"{file_path}:{number}: {err.msg}") from err
+
+def read_counts(file_path: str) -> Counter:
+    """Read the per-input match counts written with ``-c``.
+
+    Args:
+        file_path: Path to a file of ``name:count`` or bare count lines
+
+    Returns:
+        Counter of matches per input name, keyed by "" for bare counts
+
+    Raises:
+        ValueError: If a count is not an integer
+    """
+    counts: Counter = Counter()
+    with open(file_path, encoding="utf-8") as lines:
+        for number, line in enumerate(lines, 1):
+            if line.strip():
+                name, _, value = line.rstrip("\n").rpartition(":")
+                try:
+                    counts[name] += int(value)
+                except ValueError as err:
+                    raise ValueError(
+                        f"{file_path}:{number}: invalid count {value!r}"
+                    ) from err
+    return counts
+
+@merge_app.command()
+def merge(
+    files: List[str] = typer.Argument(..., help="Per-shard output files to merge"),
+    kind: str = typer.Option(
+        "entities",
+        "--kind",
+        "-k",
+        help=(
+            "Kind of shard output: entities (--format json or jsonl), "
+            "counts (-c) or names (-l)"
+        )
+    ),
+    output_format: str = typer.Option(
+        "text",
+        "--format",
+        "-o",
+        help="Output format: text, json, jsonl, or csv"
+    ),
+    include_sentence: bool = typer.Option(
+        True,
+        "--include-sentence/--no-sentence",
+        help="Include the full sentence context in output"
+    ),
+    sort_by: Optional[str] = typer.Option(
+        None,
+        "--sort",
+        "-s",
+        help=(
+            "Sort output by: text, label, position, length, or frequency; "
+            "by default entities are ordered by source and position"
+        )
+    ),
+    sort_buffer: int = typer.Option(
+        DEFAULT_BUFFER_SIZE,
+        "--sort-buffer",
+        min=1,
+        help="Entities held in memory before spilling to disk"
+    )
+):
+    """Merge per-shard nergrep outputs into one result."""
+    if kind not in MERGE_KINDS:
+        raise typer.BadParameter(
+            f"must be one of {', '.join(MERGE_KINDS)}", param_hint="--kind"
+        )
+
+    if kind == "counts":
+        counts: Counter = Counter()
+        try:
+            for file_path in files:
+                counts.update(read_counts(file_path))
+        except ValueError as err:
+            raise typer.BadParameter(str(err), param_hint="FILES") from err
+        if set(counts) == {""}:
+            print(counts[""])
+        else:
+            for name in sorted(counts, key=source_order):
+                print(f"{name}:{counts[name]}")
+        return
+
+    if kind == "names":
+        names = {
+            line
+            for file_path in files
+            for line in Path(file_path).read_text().splitlines()
+            if line.strip()
+        }
+        for name in sorted(names, key=source_order):
+            print(name)
+        return
+
+    try:
+        sorter = ExternalSorter(sort_by or "source", sort_buffer, then_by_source=True)
+    except ValueError as err:
+        raise typer.BadParameter(str(err), param_hint="--sort") from err
+    with sorter:
+        try:
+            for file_path in files:
+                sorter.add(read_entities(file_path))
+        except ValueError as err:
+            raise typer.BadParameter(str(err), param_hint="FILES") from err
+        print_entities(sorter, output_format, include_sentence)
+
+def run() -> None:
+    """Console entry point dispatching ``nergrep merge`` to the merge command."""
+    if len(sys.argv) > 1 and sys.argv[1] == "merge":
+        merge_app(args=sys.argv[2:], prog_name="nergrep merge")
+    else:
+        app()
 
 if __name__ == "__main__":
-    app()
+    run()
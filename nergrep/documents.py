@@ -0,0 +1,254 @@
+"""Input document discovery and reading."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Source name used for text given directly on the command line
+LITERAL_SOURCE = "(text)"
+
+# Shard selector as (shard number starting at 1, number of shards)
+Shard = Tuple[int, int]
+
+# Progress within one input argument as (key of the last document's input,
+# byte offset, line number); offset and line are None once that input is
+# complete
+Cursor = Tuple[str, Optional[int], Optional[int]]
+
+
+@dataclass
+class Document:
+    """A unit of input text.
+
+    Attributes:
+        source: File path the text was read from, ``path:line`` for
+            line-delimited inputs, or ``LITERAL_SOURCE``
+        text: The document text
+        key: Stable key of the input the document belongs to, used to
+            record progress: the file path, or ``(text)#N`` for the Nth
+            input argument given as literal text
+        offset: For line-delimited inputs, the byte offset just past the
+            document's line
+        line: For line-delimited inputs, the document's line number
+        index: Position of the input argument the document came from
+    """
+    source: str
+    text: str
+    key: Optional[str] = None
+    offset: Optional[int] = None
+    line: Optional[int] = None
+    index: Optional[int] = None
+
+    @property
+    def cursor(self) -> Cursor:
+        """Progress through the input argument once this document is done."""
+        return self.key, self.offset, self.line
+
+def as_path(item: str) -> Optional[Path]:
+    """Return an input as an existing path, or None if it is literal text.
+
+    Args:
+        item: Input text or path
+
+    Returns:
+        The path if it exists on disk, otherwise None
+    """
+    path = Path(item)
+    try:
+        return path if path.exists() else None
+    except OSError:  # e.g. literal text too long to be a file name
+        return None
+
+def parse_shard(value: str) -> Shard:
+    """Parse a ``K/N`` shard selector.
+
+    Args:
+        value: Shard selector, e.g. ``2/8`` for the second of eight shards
+
+    Returns:
+        Tuple of (shard number, number of shards)
+
+    Raises:
+        ValueError: If the selector is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError as err:
+        raise ValueError(f"Invalid shard '{value}', expected K/N") from err
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{value}', K must be between 1 and N")
+    return index, count
+
+def shard_of(key: str, count: int) -> int:
+    """Deterministically assign a key to one of ``count`` shards.
+
+    Uses a content hash rather than ``hash()``, which is salted per process,
+    so every machine agrees on the assignment.
+
+    Args:
+        key: Stable document key, such as a file path
+        count: Number of shards
+
+    Returns:
+        Shard number between 1 and ``count``
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count + 1
+
+def source_order(source: Optional[str]) -> Tuple[str, int]:
+    """Sort key ordering sources by path, then numerically by line.
+
+    Args:
+        source: Entity or document source, possibly ``path:line``
+
+    Returns:
+        Tuple of (path, line number)
+    """
+    if not source:
+        return "", 0
+    path, _, line = source.rpartition(":")
+    if path and line.isdigit():
+        return path, int(line)
+    return source, 0
+
+def _in_shard(key: str, shard: Optional[Shard]) -> bool:
+    """Check whether a key belongs to the selected shard."""
+    return shard is None or shard_of(key, shard[1]) == shard[0]
+
+def _shard_key(file_path: Path, root: Path) -> str:
+    """Key a file is sharded by: its path relative to the input argument.
+
+    Hashing the path as typed would assign the same file to different
+    shards on machines that spell the input differently (relative or
+    absolute, other mount points); the relative path depends only on the
+    corpus layout. A file given directly is keyed by its name.
+    """
+    if file_path == root:
+        return file_path.name
+    return file_path.relative_to(root).as_posix()
+
+def _expand_files(path: Path) -> List[Path]:
+    """List the files of a directory recursively, in sorted order."""
+    return sorted(p for p in path.rglob("*") if p.is_file())
+
+def _iter_lines(
+    path: Path,
+    source: str,
+    jsonl_field: Optional[str] = None,
+    shard: Optional[Shard] = None,
+    position: Tuple[int, int] = (0, 0),
+    shard_key: Optional[str] = None,
+    index: Optional[int] = None
+) -> Iterator[Document]:
+    """Read one document per non-empty line of a file.
+
+    Args:
+        path: File to read
+        source: Name of the file used in document sources
+        jsonl_field: Optional JSON field holding the document text
+        shard: Optional shard selector
+        position: Byte offset and number of the last line already processed
+        shard_key: Key of the file lines are sharded by, as ``key:line``;
+            defaults to ``source``
+        index: Position of the input argument the file belongs to
+
+    Yields:
+        Documents for the lines after ``position``
+    """
+    offset, line_number = position
+    with path.open("rb") as lines:
+        lines.seek(offset)
+        for raw_line in lines:
+            offset += len(raw_line)
+            line_number += 1
+            line = raw_line.decode("utf-8").rstrip("\r\n")
+            line_source = f"{source}:{line_number}"
+            line_key = f"{shard_key or source}:{line_number}"
+            if not line.strip() or not _in_shard(line_key, shard):
+                continue
+            if jsonl_field is not None:
+                line = json.loads(line).get(jsonl_field) or ""
+            yield Document(
+                source=line_source,
+                text=line,
+                key=source,
+                offset=offset,
+                line=line_number,
+                index=index
+            )
+
+def iter_documents(
+    inputs: Iterable[str],
+    lines: bool = False,
+    jsonl_field: Optional[str] = None,
+    shard: Optional[Shard] = None,
+    cursors: Optional[Dict[int, Cursor]] = None
+) -> Iterator[Document]:
+    """Resolve inputs to documents.
+
+    Each input is a file path, a directory (whose files are read recursively
+    in sorted order) or, if no such path exists, literal text. Files are read
+    lazily, one at a time.
+
+    Args:
+        inputs: Input texts, file paths or directory paths
+        lines: Treat every non-empty line of a file as a separate document
+        jsonl_field: Treat files as JSON Lines and read document text from
+            this field (implies ``lines``)
+        shard: Only yield documents assigned to this shard; whole files are
+            sharded by their path relative to the input argument (or name,
+            for a file argument), line documents by ``path:line``
+        cursors: Progress to resume from per input argument index, e.g.
+            from a checkpoint. Files of a directory are read in sorted
+            order, so files before the cursor's file are skipped, the
+            cursor's file is skipped or resumed from its byte offset, and
+            later files are read in full
+
+    Yields:
+        Documents in input order
+    """
+    lines = lines or jsonl_field is not None
+    cursors = cursors or {}
+    for index, item in enumerate(inputs):
+        cursor = cursors.get(index)
+        path = as_path(item)
+        if path is None:
+            key = f"{LITERAL_SOURCE}#{index}"
+            if cursor is None and _in_shard(item, shard):
+                yield Document(
+                    source=LITERAL_SOURCE, text=item, key=key, index=index
+                )
+            continue
+
+        files = _expand_files(path) if path.is_dir() else [path]
+        for file_path in files:
+            source = item if file_path is path else str(file_path)
+            position = (0, 0)
+            if cursor is not None:
+                cursor_path = Path(cursor[0])
+                if file_path < cursor_path:
+                    continue
+                if file_path == cursor_path:
+                    if cursor[1] is None:
+                        continue
+                    position = (cursor[1], cursor[2])
+            shard_key = _shard_key(file_path, path)
+            if lines:
+                yield from _iter_lines(
+                    file_path,
+                    source,
+                    jsonl_field,
+                    shard,
+                    position,
+                    shard_key,
+                    index
+                )
+            elif _in_shard(shard_key, shard):
+                yield Document(
+                    source=source,
+                    text=file_path.read_text(),
+                    key=source,
+                    index=index
+                )
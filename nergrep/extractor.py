@@ -1,78 +1,669 @@
 """Entity extraction functionality."""
 
-from typing import List, Optional, Set
+import re
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import spacy
+from spacy.language import Language
 from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
 
+from .langid import LanguageIdentifier
+from .scheduler import AdaptiveBatcher, Item, current_rss, estimate_tokens
 from .types import EntityRecord
 
-# Initialize spaCy model and custom entity patterns
-try:
-    # Load the English language model
-    nlp = spacy.load("en_core_web_lg")
-except OSError as err:
-    raise RuntimeError(
-        "spaCy model 'en_core_web_lg' not found. "
-        "Please install it using: python -m spacy download en_core_web_lg"
-    ) from err
-
-# Add custom entity patterns
-matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+# Model used for extraction unless another one is requested
+DEFAULT_MODEL = "en_core_web_lg"
+
+# Custom entity patterns added to every loaded model
 org_patterns = [
     "Python Software Foundation",
     "The Python Software Foundation",
     "CWI",
     "PSF"
 ]
-patterns = [nlp(text) for text in org_patterns]
-matcher.add("ORG", patterns)
 
-def extract_entities(
-    text: str,
-    types: Optional[Set[str]] = None
-) -> List[EntityRecord]:
-    """Extract named entities from text using spaCy's NER model.
+# Number of models, besides pinned ones, kept loaded by the model pool
+DEFAULT_MAX_MODELS = 2
+
+# Model used for documents in each language; documents in languages without
+# an installed model here are parsed with DEFAULT_MODEL
+LANGUAGE_MODELS = {
+    "en": DEFAULT_MODEL,
+    "de": "de_core_news_lg",
+    "fr": "fr_core_news_lg",
+    "es": "es_core_news_lg",
+    "it": "it_core_news_lg",
+    "pt": "pt_core_news_lg",
+    "nl": "nl_core_news_lg",
+    "da": "da_core_news_lg",
+    "sv": "sv_core_news_lg",
+    "nb": "nb_core_news_lg",
+    "fi": "fi_core_news_lg",
+    "pl": "pl_core_news_lg",
+    "ro": "ro_core_news_lg",
+    "ca": "ca_core_news_lg",
+    "el": "el_core_news_lg",
+    "ru": "ru_core_news_lg",
+    "zh": "zh_core_web_lg",
+    "ja": "ja_core_news_lg",
+    "ko": "ko_core_news_lg",
+}
+
+def _load(name: str) -> Tuple[Language, PhraseMatcher]:
+    """Load a spaCy model and build its custom pattern matcher.
+
+    Raises:
+        RuntimeError: If the model is not installed
+    """
+    try:
+        model = spacy.load(name)
+    except OSError as err:
+        raise RuntimeError(
+            f"spaCy model '{name}' not found. "
+            f"Please install it using: python -m spacy download {name}"
+        ) from err
+    model_matcher = PhraseMatcher(model.vocab, attr="LOWER")
+    model_matcher.add("ORG", [model(text) for text in org_patterns])
+    return model, model_matcher
+
+class ModelPool:
+    """Size-bounded LRU pool of lazily loaded spaCy models.
+
+    Models are loaded on first use. Once more than ``max_models`` unpinned
+    models are loaded, the least recently used one is evicted; with
+    ``max_idle`` set, models unused for that many seconds are evicted too.
+    Pinned models are never evicted and do not count towards the limit.
+
+    Attributes:
+        max_models: Maximum number of unpinned models kept loaded
+        max_idle: Seconds after which an unused model is evicted, if set
+        pinned: Names of models that stay loaded
+        loads: Number of models loaded so far
+        evictions: Number of models evicted so far
+    """
+
+    def __init__(
+        self,
+        max_models: int = DEFAULT_MAX_MODELS,
+        max_idle: Optional[float] = None,
+        pinned: Iterable[str] = ()
+    ):
+        """Create an empty pool.
+
+        Args:
+            max_models: Maximum number of unpinned models kept loaded
+            max_idle: Seconds after which an unused model is evicted
+            pinned: Names of models that are never evicted
+
+        Raises:
+            ValueError: If ``max_models`` is less than 1
+        """
+        if max_models < 1:
+            raise ValueError("max_models must be at least 1")
+        self.max_models = max_models
+        self.max_idle = max_idle
+        self.pinned = set(pinned)
+        self.loads = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Language, PhraseMatcher]]" = (
+            OrderedDict()
+        )
+        self._last_used: Dict[str, float] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str) -> Tuple[Language, PhraseMatcher]:
+        """Return a model and its custom pattern matcher, loading if needed.
+
+        Args:
+            name: Name of an installed spaCy model package
+
+        Returns:
+            Tuple of (spaCy pipeline, custom pattern matcher)
+
+        Raises:
+            RuntimeError: If the model is not installed
+        """
+        now = time.monotonic()
+        self.evict_idle(now)
+        if name in self._entries:
+            self._entries.move_to_end(name)
+        else:
+            self._entries[name] = _load(name)
+            self.loads += 1
+        self._last_used[name] = now
+
+        # Evict least recently used models beyond the limit
+        unpinned = [n for n in self._entries if n not in self.pinned]
+        for evicted in unpinned[:max(len(unpinned) - self.max_models, 0)]:
+            self._evict(evicted)
+        return self._entries[name]
+
+    def evict_idle(self, now: Optional[float] = None) -> None:
+        """Evict unpinned models unused for longer than ``max_idle``.
+
+        Args:
+            now: Current ``time.monotonic()`` value
+        """
+        if self.max_idle is None:
+            return
+        now = time.monotonic() if now is None else now
+        for name in list(self._entries):
+            idle = now - self._last_used[name]
+            if name not in self.pinned and idle > self.max_idle:
+                self._evict(name)
+
+    def _evict(self, name: str) -> None:
+        """Drop a model from the pool."""
+        del self._entries[name]
+        del self._last_used[name]
+        self.evictions += 1
+
+# Loaded models; the default model backs the module-level ``nlp`` and so
+# stays loaded
+model_pool = ModelPool(pinned=[DEFAULT_MODEL])
+
+def load_model(name: str = DEFAULT_MODEL) -> Language:
+    """Load a spaCy model through the model pool.
 
     Args:
-        text: Input text to process
-        types: Optional set of entity types to include (e.g., {'PERSON', 'ORG', 'GPE'})
+        name: Name of an installed spaCy model package
 
     Returns:
-        List of extracted entity records containing text, label, sentence context,
-        and character positions
+        The loaded spaCy pipeline
 
     Raises:
-        RuntimeError: If spaCy model is not properly loaded
+        RuntimeError: If the model is not installed
+    """
+    return model_pool.get(name)[0]
+
+def installed_language_models(
+    models: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Restrict a language to model mapping to installed models.
+
+    Args:
+        models: Model name per language code; defaults to ``LANGUAGE_MODELS``
+
+    Returns:
+        The entries whose model package is installed
+    """
+    models = LANGUAGE_MODELS if models is None else models
+    return {
+        language: name for language, name in models.items()
+        if spacy.util.is_package(name)
+    }
+
+def parse_model_map(value: str) -> Dict[str, str]:
+    """Parse a ``lang=model,...`` language to model mapping.
+
+    Args:
+        value: Mapping such as ``de=de_core_news_sm,fr=fr_core_news_sm``
+
+    Returns:
+        Model name per language code
+
+    Raises:
+        ValueError: If an entry is not of the form ``lang=model``
+    """
+    models = {}
+    for entry in value.split(","):
+        language, _, name = entry.partition("=")
+        if not language.strip() or not name.strip():
+            raise ValueError(f"Invalid model mapping '{entry}', expected lang=model")
+        models[language.strip()] = name.strip()
+    return models
+
+# Initialize spaCy model and custom entity patterns
+nlp, matcher = model_pool.get(DEFAULT_MODEL)
+
+# Fast rule-based sentence splitter used to select NER windows
+sentencizer = spacy.blank("en")
+sentencizer.add_pipe("sentencizer")
+
+# Paragraph breaks at which documents may be split into chunks
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# Default approximate chunk size (in characters) for incremental extraction
+DEFAULT_CHUNK_CHARS = 10000
+
+# Labels the small English models are markedly less reliable on than the
+# large ones; spaCy's NER exposes no per-entity confidence to use instead
+UNCERTAIN_LABELS = frozenset({
+    "EVENT", "FAC", "LANGUAGE", "LAW", "NORP", "PRODUCT", "WORK_OF_ART"
+})
+
+@dataclass
+class CascadeConfig:
+    """Escalation rules for cascaded extraction.
+
+    Every text is parsed with ``fast_model`` first. A unit (sentence or whole
+    text) is re-parsed with ``accurate_model`` if the fast model found an
+    entity with one of ``uncertain_labels`` or ``escalate_types``, or if
+    ``candidate`` accepts the unit text.
+
+    Attributes:
+        fast_model: Name of the fast spaCy model
+        accurate_model: Name of the model used for escalated units
+        escalate_types: Entity types that always trigger escalation
+        uncertain_labels: Labels the fast model is not trusted on
+        candidate: Optional cheap test that triggers escalation
+        per_sentence: Escalate single sentences rather than whole texts
+    """
+    fast_model: str = "en_core_web_sm"
+    accurate_model: str = DEFAULT_MODEL
+    escalate_types: Set[str] = field(default_factory=set)
+    uncertain_labels: Set[str] = field(default_factory=lambda: set(UNCERTAIN_LABELS))
+    candidate: Optional[Callable[[str], bool]] = None
+    per_sentence: bool = True
+
+@dataclass
+class CascadeStats:
+    """Counts of units seen and escalated by cascaded extraction.
+
+    Attributes:
+        units: Number of sentences or texts parsed with the fast model
+        escalated: Number of those re-parsed with the accurate model
+    """
+    units: int = 0
+    escalated: int = 0
+
+    @property
+    def escalation_rate(self) -> float:
+        """Fraction of units escalated to the accurate model."""
+        return self.escalated / self.units if self.units else 0.0
+
+def _doc_entities(
+    doc: Doc,
+    types: Optional[Set[str]] = None,
+    offset: int = 0,
+    doc_matcher: Optional[PhraseMatcher] = None
+) -> List[EntityRecord]:
+    """Collect custom matches and NER entities from a parsed document.
+
+    Args:
+        doc: Parsed spaCy document
+        types: Optional set of entity types to include
+        offset: Character offset of ``doc`` within the original text
+        doc_matcher: Custom pattern matcher for the model that parsed
+            ``doc``; defaults to the default model's matcher
+
+    Returns:
+        List of entity records with positions relative to the original text
     """
-    doc = nlp(text)
     entities = []
 
     # Add custom matches first
-    matches = matcher(doc)
+    custom_spans = set()
+    matches = (doc_matcher or matcher)(doc)
     for _match_id, start, end in matches:
         span = doc[start:end]
         if types is None or "ORG" in types:
+            custom_spans.add((span.start_char, span.end_char))
             entities.append(EntityRecord(
                 text=span.text,
                 label="ORG",
                 sentence=span.sent.text.strip(),
-                start=span.start_char,
-                end=span.end_char
+                start=offset + span.start_char,
+                end=offset + span.end_char
             ))
 
     # Then add spaCy's NER matches
     for ent in doc.ents:
         # Skip if we already have a custom match for this span
-        if any(e.start == ent.start_char and e.end == ent.end_char for e in entities):
+        if (ent.start_char, ent.end_char) in custom_spans:
             continue
         if types is None or ent.label_ in types:
             entities.append(EntityRecord(
                 text=ent.text,
                 label=ent.label_,
                 sentence=ent.sent.text.strip(),
-                start=ent.start_char,
-                end=ent.end_char
+                start=offset + ent.start_char,
+                end=offset + ent.end_char
             ))
 
     return entities
+
+def extract_entities(
+    text: str,
+    types: Optional[Set[str]] = None
+) -> List[EntityRecord]:
+    """Extract named entities from text using spaCy's NER model.
+
+    Args:
+        text: Input text to process
+        types: Optional set of entity types to include (e.g., {'PERSON', 'ORG', 'GPE'})
+
+    Returns:
+        List of extracted entity records containing text, label, sentence context,
+        and character positions
+
+    Raises:
+        RuntimeError: If spaCy model is not properly loaded
+    """
+    return _doc_entities(nlp(text), types)
+
+def _pipe_batches(
+    items: List[Item],
+    model: Language,
+    model_matcher: PhraseMatcher,
+    types: Optional[Set[str]],
+    batcher: AdaptiveBatcher,
+    results: Dict[int, List[EntityRecord]]
+) -> None:
+    """Run a window of items through a model in token-budgeted batches.
+
+    Args:
+        items: Window of (position, text) items
+        model: spaCy pipeline to parse the texts with
+        model_matcher: Custom pattern matcher of ``model``
+        types: Optional set of entity types to include
+        batcher: Batch scheduler, updated after every batch
+        results: Entity records per position, filled in place
+    """
+    for batch in batcher.batches(items):
+        started = time.perf_counter()
+        docs = model.pipe((text for _, text in batch), batch_size=len(batch))
+        for (position, _text), doc in zip(batch, docs):
+            results[position] = _doc_entities(doc, types, 0, model_matcher)
+        batcher.observe(
+            len(batch),
+            sum(estimate_tokens(text) for _, text in batch),
+            time.perf_counter() - started,
+            current_rss()
+        )
+
+def extract_many(
+    texts: Iterable[str],
+    types: Optional[Set[str]] = None,
+    batcher: Optional[AdaptiveBatcher] = None
+) -> Iterator[List[EntityRecord]]:
+    """Extract named entities from many texts with adaptive batching.
+
+    Texts are read a window at a time, grouped by length into batches that
+    fit the batcher's token budget and run through ``nlp.pipe``; results are
+    yielded in the original order.
+
+    Args:
+        texts: Input texts to process
+        types: Optional set of entity types to include
+        batcher: Batch scheduler; defaults to ``AdaptiveBatcher()``
+
+    Yields:
+        One list of entity records per input text, in input order
+    """
+    batcher = batcher or AdaptiveBatcher()
+    iterator = iter(texts)
+    while True:
+        window = list(enumerate(islice(iterator, batcher.window)))
+        if not window:
+            return
+        results: Dict[int, List[EntityRecord]] = {}
+        _pipe_batches(window, nlp, matcher, types, batcher, results)
+        for position in range(len(window)):
+            yield results.pop(position)
+
+def extract_multilingual(
+    texts: Iterable[str],
+    types: Optional[Set[str]] = None,
+    batcher: Optional[AdaptiveBatcher] = None,
+    models: Optional[Dict[str, str]] = None,
+    identifier: Optional[LanguageIdentifier] = None,
+    languages: Optional[Counter] = None
+) -> Iterator[List[EntityRecord]]:
+    """Extract named entities from texts in mixed languages.
+
+    Texts are read a window at a time and their language identified. Each
+    window is grouped by the model its languages map to, and every group is
+    run through its model (taken from ``model_pool``) in token-budgeted
+    batches, so a model is loaded at most once per window however the
+    languages are interleaved. Results are yielded in the original order.
+
+    Entity labels follow each model's own scheme; the German, French and
+    other ``news`` models, for instance, label people ``PER`` and
+    miscellaneous names ``MISC``.
+
+    Args:
+        texts: Input texts to process
+        types: Optional set of entity types to include
+        batcher: Batch scheduler; defaults to ``AdaptiveBatcher()``
+        models: Model name per language code; defaults to the installed
+            models of ``LANGUAGE_MODELS``. Other languages use DEFAULT_MODEL
+        identifier: Language identifier; defaults to ``LanguageIdentifier()``
+        languages: Optional counter updated with texts seen per language
+
+    Yields:
+        One list of entity records per input text, in input order
+
+    Raises:
+        RuntimeError: If a mapped model is not installed
+    """
+    batcher = batcher or AdaptiveBatcher()
+    models = installed_language_models() if models is None else models
+    identifier = identifier or LanguageIdentifier()
+    iterator = iter(texts)
+    while True:
+        window = list(enumerate(islice(iterator, batcher.window)))
+        if not window:
+            return
+
+        # Batch documents per model
+        groups: Dict[str, List[Item]] = {}
+        for item in window:
+            language = identifier.detect(item[1])
+            if languages is not None:
+                languages[language] += 1
+            name = models.get(language, DEFAULT_MODEL)
+            groups.setdefault(name, []).append(item)
+
+        # Start with models already loaded, so none is evicted and reloaded
+        # within the window
+        results: Dict[int, List[EntityRecord]] = {}
+        for name, items in sorted(groups.items(), key=lambda g: g[0] not in model_pool):
+            model, model_matcher = model_pool.get(name)
+            _pipe_batches(items, model, model_matcher, types, batcher, results)
+        for position in range(len(window)):
+            yield results.pop(position)
+
+def _should_escalate(
+    text: str,
+    entities: List[EntityRecord],
+    cascade: CascadeConfig
+) -> bool:
+    """Apply the cascade escalation rules to one unit of text."""
+    if any(
+        e.label in cascade.uncertain_labels or e.label in cascade.escalate_types
+        for e in entities
+    ):
+        return True
+    return cascade.candidate is not None and cascade.candidate(text)
+
+def extract_entities_cascade(
+    text: str,
+    types: Optional[Set[str]] = None,
+    cascade: Optional[CascadeConfig] = None,
+    stats: Optional[CascadeStats] = None,
+    offset: int = 0
+) -> List[EntityRecord]:
+    """Extract named entities with a fast model, escalating where needed.
+
+    Units the escalation rules select are re-parsed with the accurate model
+    and their entities replace the fast model's; all other entities come
+    from the fast model.
+
+    Args:
+        text: Input text to process
+        types: Optional set of entity types to include
+        cascade: Escalation rules; defaults to ``CascadeConfig()``
+        stats: Optional counters updated with units seen and escalated
+        offset: Character offset of ``text`` within the original document
+
+    Returns:
+        List of extracted entity records in unit order
+
+    Raises:
+        RuntimeError: If a cascade model is not installed
+    """
+    cascade = cascade or CascadeConfig()
+    stats = stats if stats is not None else CascadeStats()
+    fast, fast_matcher = model_pool.get(cascade.fast_model)
+    fast_doc = fast(text)
+
+    if cascade.per_sentence:
+        units = [(sent.start_char, sent.end_char) for sent in fast_doc.sents]
+    else:
+        units = [(0, len(text))]
+
+    # Assign the fast model's entities to the unit they start in
+    unit_starts = [start for start, _end in units]
+    unit_entities: List[List[EntityRecord]] = [[] for _ in units]
+    fast_entities = _doc_entities(fast_doc, None, 0, fast_matcher)
+    for entity in fast_entities:
+        unit = max(bisect_right(unit_starts, entity.start) - 1, 0)
+        unit_entities[unit].append(entity)
+
+    entities = []
+    for (start, end), candidates in zip(units, unit_entities):
+        stats.units += 1
+        unit_text = text[start:end]
+        if _should_escalate(unit_text, candidates, cascade):
+            stats.escalated += 1
+            accurate, accurate_matcher = model_pool.get(cascade.accurate_model)
+            entities.extend(_doc_entities(
+                accurate(unit_text), types, offset + start, accurate_matcher
+            ))
+            continue
+        for entity in candidates:
+            if types is None or entity.label in types:
+                entity.start += offset
+                entity.end += offset
+                entities.append(entity)
+
+    return entities
+
+def iter_chunks(
+    text: str,
+    max_chars: int = DEFAULT_CHUNK_CHARS
+) -> Iterator[Tuple[int, str]]:
+    """Split text into chunks at paragraph breaks.
+
+    Paragraphs are grouped until a chunk reaches ``max_chars``; a single
+    paragraph is never split, so chunks may be longer than ``max_chars``.
+
+    Args:
+        text: Input text to split
+        max_chars: Approximate maximum chunk size in characters
+
+    Yields:
+        Tuples of (character offset, chunk text)
+    """
+    start = 0
+    for match in PARAGRAPH_BREAK.finditer(text):
+        if match.end() - start >= max_chars:
+            yield start, text[start:match.end()]
+            start = match.end()
+    if start < len(text):
+        yield start, text[start:]
+
+def iter_windows(
+    text: str,
+    candidate: Optional[Callable[[str], bool]] = None,
+    neighbours: int = 1
+) -> Iterator[Tuple[int, str]]:
+    """Select sentence windows around candidate sentences.
+
+    Sentences are found with a rule-based sentencizer. Each sentence passing
+    ``candidate`` is widened by ``neighbours`` sentences on either side, and
+    overlapping or adjacent windows are merged.
+
+    Args:
+        text: Input text to split
+        candidate: Cheap test selecting sentences; all sentences if None
+        neighbours: Number of sentences to include on either side
+
+    Yields:
+        Tuples of (character offset, window text) in document order
+
+    Raises:
+        ValueError: If ``neighbours`` is negative
+    """
+    if neighbours < 0:
+        raise ValueError("neighbours must be at least 0")
+
+    # Sentencize paragraph chunks to stay within spaCy's max_length
+    chunks = list(iter_chunks(text))
+    sentences = [
+        (offset + sent.start_char, offset + sent.end_char)
+        for (offset, _chunk), doc in zip(
+            chunks, sentencizer.pipe(chunk for _offset, chunk in chunks)
+        )
+        for sent in doc.sents
+    ]
+    run_start = run_end = None
+    for index, (start, end) in enumerate(sentences):
+        if candidate is not None and not candidate(text[start:end]):
+            continue
+        first = max(index - neighbours, 0)
+        last = min(index + neighbours, len(sentences) - 1)
+        if run_end is not None and first <= run_end + 1:
+            run_end = max(run_end, last)
+            continue
+        if run_end is not None:
+            window_start = sentences[run_start][0]
+            yield window_start, text[window_start:sentences[run_end][1]]
+        run_start, run_end = first, last
+    if run_end is not None:
+        window_start = sentences[run_start][0]
+        yield window_start, text[window_start:sentences[run_end][1]]
+
+def iter_entities(
+    text: str,
+    types: Optional[Set[str]] = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    candidate: Optional[Callable[[str], bool]] = None,
+    window: Optional[int] = None,
+    cascade: Optional[CascadeConfig] = None,
+    stats: Optional[CascadeStats] = None
+) -> Iterator[EntityRecord]:
+    """Lazily extract named entities chunk by chunk.
+
+    Chunks are only parsed when the caller asks for more entities, so a
+    consumer that stops iterating early skips the rest of the document.
+
+    Args:
+        text: Input text to process
+        types: Optional set of entity types to include
+        chunk_chars: Approximate chunk size in characters
+        candidate: Optional cheap test; chunks failing it are not parsed
+        window: If set, parse only sentences passing ``candidate`` plus this
+            many neighbouring sentences instead of paragraph chunks
+        cascade: If set, extract each segment with cascaded models
+        stats: Optional cascade counters to update
+
+    Yields:
+        Entity records in document order, with positions relative to ``text``
+    """
+    if window is not None:
+        segments = iter_windows(text, candidate, window)
+    else:
+        segments = (
+            (offset, chunk) for offset, chunk in iter_chunks(text, chunk_chars)
+            if candidate is None or candidate(chunk)
+        )
+    for offset, segment in segments:
+        if cascade is not None:
+            yield from extract_entities_cascade(
+                segment, types, cascade, stats, offset
+            )
+        else:
+            yield from _doc_entities(nlp(segment), types, offset)
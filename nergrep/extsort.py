@@ -0,0 +1,242 @@
+"""External-memory sorting of entity records."""
+
+import heapq
+import json
+import os
+import shutil
+import tempfile
+from collections import Counter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .documents import source_order
+from .types import EntityRecord
+
+# Number of records held in memory before a sorted run is spilled to disk
+DEFAULT_BUFFER_SIZE = 1000000
+
+# Maximum number of runs merged at once, to bound open file handles
+MAX_FAN_IN = 64
+
+SortKey = Callable[[EntityRecord], Any]
+FrequencyKey = Tuple[str, str]
+
+
+def frequency_key(entity: EntityRecord) -> FrequencyKey:
+    """Return the key entities are grouped by when counting frequency.
+
+    Entities resolved to a canonical ID are grouped by that ID whatever
+    their text and label, all others by text and label.
+    """
+    if entity.canonical_id is not None:
+        # No extracted entity has an empty label, so keys cannot collide
+        return entity.canonical_id, ""
+    return entity.text, entity.label
+
+def sort_key(
+    sort_by: str,
+    counts: Optional[Counter] = None,
+    then_by_source: bool = False
+) -> SortKey:
+    """Build the sort key function for a ``--sort`` option.
+
+    Args:
+        sort_by: Sort key: text, label, position, length, frequency or
+            source (by source, then position)
+        counts: Occurrences per ``frequency_key``; required for frequency
+        then_by_source: Break ties by source and position
+
+    Returns:
+        Function mapping an entity record to its sort key
+
+    Raises:
+        ValueError: If ``sort_by`` is not a known sort key
+    """
+    if then_by_source:
+        key = sort_key(sort_by, counts)
+        return lambda x: (key(x), source_order(x.source), x.start)
+    if sort_by == "text":
+        return lambda x: x.text.lower()
+    if sort_by == "label":
+        return lambda x: (x.label, x.text.lower())
+    if sort_by == "position":
+        return lambda x: x.start
+    if sort_by == "length":
+        return lambda x: len(x.text)
+    if sort_by == "frequency":
+        # Sort by frequency (descending), keeping canonical groups together,
+        # and then by text
+        return lambda x: (
+            -counts[frequency_key(x)], x.canonical_id or "", x.text.lower()
+        )
+    if sort_by == "source":
+        return lambda x: (source_order(x.source), x.start)
+    raise ValueError(f"Unknown sort key '{sort_by}'")
+
+def _write_run(records: Iterable[EntityRecord], path: str) -> None:
+    """Write records to a run file, one JSON array per line."""
+    with open(path, "w", encoding="utf-8") as run:
+        for r in records:
+            fields = [
+                r.text, r.label, r.sentence, r.start, r.end, r.source,
+                r.canonical_id
+            ]
+            run.write(json.dumps(fields))
+            run.write("\n")
+
+def _read_run(path: str) -> Iterator[EntityRecord]:
+    """Read back the records of a run file."""
+    with open(path, encoding="utf-8") as run:
+        for line in run:
+            yield EntityRecord(*json.loads(line))
+
+class ExternalSorter:
+    """Sort entity records within a bounded memory budget.
+
+    Records are buffered in memory; once ``buffer_size`` records are held,
+    the buffer is sorted and spilled to a temporary run file. Iterating the
+    sorter k-way merges the runs. Sorting is stable, like ``list.sort``.
+
+    Frequency sorting needs every count before any key is known, so it runs
+    in two passes: the first counts occurrences while spilling unsorted
+    runs, the second sorts those runs with the final counts.
+
+    Attributes:
+        sort_by: Sort key name, see ``sort_key``
+        then_by_source: Whether ties are broken by source and position
+        counts: Occurrences per ``frequency_key`` seen so far
+        runs: Number of runs spilled to disk
+    """
+
+    def __init__(
+        self,
+        sort_by: str,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        tmp_dir: Optional[str] = None,
+        then_by_source: bool = False
+    ):
+        """Create a sorter.
+
+        Args:
+            sort_by: Sort key name, see ``sort_key``
+            buffer_size: Maximum number of records held in memory
+            tmp_dir: Directory for temporary run files
+            then_by_source: Break ties by source and position
+
+        Raises:
+            ValueError: If ``sort_by`` is not a known sort key, or
+                ``buffer_size`` is less than 1
+        """
+        sort_key(sort_by)  # Fail early on unknown sort keys
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.sort_by = sort_by
+        self.then_by_source = then_by_source
+        self.buffer_size = buffer_size
+        self.tmp_dir = tmp_dir
+        self.counts: Counter = Counter()
+        self.runs = 0
+        self._buffer: List[EntityRecord] = []
+        self._run_paths: List[str] = []
+        self._work_dir: Optional[str] = None
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, records: Iterable[EntityRecord]) -> None:
+        """Add records to be sorted.
+
+        Args:
+            records: Entity records in input order
+        """
+        for record in records:
+            self._buffer.append(record)
+            if self.sort_by == "frequency":
+                self.counts[frequency_key(record)] += 1
+            if len(self._buffer) >= self.buffer_size:
+                self._spill()
+
+    def __iter__(self) -> Iterator[EntityRecord]:
+        """Yield all added records in sorted order."""
+        key = self._key()
+        if not self._run_paths:
+            yield from sorted(self._buffer, key=key)
+            return
+
+        self._spill()
+        if self.sort_by == "frequency":
+            # Second pass: sort the unsorted runs now that counts are final
+            unsorted, self._run_paths = self._run_paths, []
+            for path in unsorted:
+                self._buffer = sorted(_read_run(path), key=key)
+                self._spill()
+                os.remove(path)
+
+        # Merge runs in groups to bound open files; merging adjacent runs
+        # keeps the merge stable
+        while len(self._run_paths) > MAX_FAN_IN:
+            group = self._run_paths[:MAX_FAN_IN]
+            merged = self._new_run_path()
+            _write_run(heapq.merge(*map(_read_run, group), key=key), merged)
+            for path in group:
+                os.remove(path)
+            self._run_paths = [merged] + self._run_paths[MAX_FAN_IN:]
+
+        yield from heapq.merge(*map(_read_run, self._run_paths), key=key)
+
+    def close(self) -> None:
+        """Remove temporary run files."""
+        if self._work_dir is not None:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+        self._run_paths = []
+        self._buffer = []
+
+    def _key(self) -> SortKey:
+        """Return the sort key function using the current counts."""
+        return sort_key(self.sort_by, self.counts, self.then_by_source)
+
+    def _new_run_path(self) -> str:
+        """Return a fresh run file path in the work directory."""
+        if self._work_dir is None:
+            self._work_dir = tempfile.mkdtemp(
+                prefix="nergrep-sort-", dir=self.tmp_dir
+            )
+        self.runs += 1
+        return os.path.join(self._work_dir, f"run-{self.runs:06d}.jsonl")
+
+    def _spill(self) -> None:
+        """Write the buffer to a new run, sorted unless counts are pending."""
+        if not self._buffer:
+            return
+        if self.sort_by != "frequency":
+            self._buffer.sort(key=self._key())
+        path = self._new_run_path()
+        _write_run(self._buffer, path)
+        self._run_paths.append(path)
+        self._buffer = []
+
+def external_sort(
+    records: Iterable[EntityRecord],
+    sort_by: str,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    tmp_dir: Optional[str] = None,
+    then_by_source: bool = False
+) -> Iterator[EntityRecord]:
+    """Sort entity records, spilling to disk beyond ``buffer_size`` records.
+
+    Args:
+        records: Entity records to sort
+        sort_by: Sort key name, see ``sort_key``
+        buffer_size: Maximum number of records held in memory
+        tmp_dir: Directory for temporary run files
+        then_by_source: Break ties by source and position
+
+    Yields:
+        Entity records in sorted order
+    """
+    with ExternalSorter(sort_by, buffer_size, tmp_dir, then_by_source) as sorter:
+        sorter.add(records)
+        yield from sorter
@@ -1,8 +1,9 @@
 """Entity filtering functionality."""
 
 import re
-from dataclasses import dataclass
-from typing import List, Optional, Set
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, TypeVar
 
 from rapidfuzz import fuzz
 
@@ -10,6 +11,88 @@ from .types import EntityRecord
 
 # Type alias to reduce line length
 EntityList = List[EntityRecord]
+TextPredicate = Callable[[str], bool]
+T = TypeVar("T")
+
+class TextMemo:
+    """Bounded LRU memo of per-text predicate results.
+
+    Entity strings recur heavily in real corpora, so expensive predicates
+    (fuzzy scores, regex searches) are cached by entity text and evaluated
+    once per distinct string. Any other function of the text, such as
+    canonical ID resolution, can be memoized the same way.
+
+    Attributes:
+        maxsize: Maximum number of cached results
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that evaluated the predicate
+        evictions: Number of results dropped to respect ``maxsize``
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Return cache statistics as a dictionary."""
+        return {
+            "size": len(self._results),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached results and reset statistics."""
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def wrap(
+        self,
+        namespace: Hashable,
+        predicate: Callable[[str], T]
+    ) -> Callable[[str], T]:
+        """Memoize a text predicate under the given namespace.
+
+        Args:
+            namespace: Key identifying the predicate and its parameters
+            predicate: Function evaluated on cache misses
+
+        Returns:
+            Predicate that consults the cache before evaluating
+        """
+        results = self._results
+
+        def memoized(text: str) -> T:
+            key = (namespace, text)
+            try:
+                result = results[key]
+            except KeyError:
+                self.misses += 1
+                result = predicate(text)
+                results[key] = result
+                if len(results) > self.maxsize:
+                    results.popitem(last=False)
+                    self.evictions += 1
+                return result
+            self.hits += 1
+            results.move_to_end(key)
+            return result
+
+        return memoized
 
 @dataclass
 class FilterConfig:
@@ -23,6 +106,59 @@ class FilterConfig:
     partial_word: Optional[str] = None
     min_length: Optional[int] = None
     max_length: Optional[int] = None
+    memo_size: int = 65536
+    memo: TextMemo = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.memo = TextMemo(self.memo_size)
+
+def _memoize(
+    memo: Optional[TextMemo],
+    namespace: Hashable,
+    predicate: TextPredicate
+) -> TextPredicate:
+    """Wrap a predicate with the memo if one is given."""
+    return predicate if memo is None else memo.wrap(namespace, predicate)
+
+def _fuzzy_predicate(
+    pattern: str,
+    threshold: float,
+    memo: Optional[TextMemo] = None
+) -> TextPredicate:
+    """Build the fuzzy match predicate used by the filters."""
+    pattern_lower = pattern.lower()
+
+    def predicate(text: str) -> bool:
+        return fuzz.partial_ratio(text.lower(), pattern_lower) >= threshold
+
+    return _memoize(memo, ("fuzzy", pattern_lower, threshold), predicate)
+
+def _regex_predicate(
+    pattern: str,
+    memo: Optional[TextMemo] = None
+) -> Optional[TextPredicate]:
+    """Build the regex predicate, or None if the pattern is invalid."""
+    try:
+        regex = re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+    def predicate(text: str) -> bool:
+        return regex.search(text) is not None
+
+    return _memoize(memo, ("regex", pattern), predicate)
+
+def _partial_word_predicate(
+    word: str,
+    memo: Optional[TextMemo] = None
+) -> TextPredicate:
+    """Build the partial word predicate used by the filters."""
+    word_lower = word.lower()
+
+    def predicate(text: str) -> bool:
+        return word_lower in text.lower()
+
+    return _memoize(memo, ("partial", word_lower), predicate)
 
 def filter_by_type(
     entities: EntityList,
@@ -55,9 +191,10 @@ def filter_by_blacklist(
     Returns:
         Filtered list of entities
     """
+    blacklist_lower = {word.lower() for word in blacklist}
     return [
         entity for entity in entities
-        if entity.text.lower() not in {word.lower() for word in blacklist}
+        if entity.text.lower() not in blacklist_lower
     ]
 
 def filter_by_whitelist(
@@ -82,7 +219,8 @@ def filter_by_whitelist(
 def filter_by_fuzzy_match(
     entities: EntityList,
     pattern: str,
-    threshold: float = 80.0
+    threshold: float = 80.0,
+    memo: Optional[TextMemo] = None
 ) -> EntityList:
     """Filter entities by fuzzy matching their text.
 
@@ -90,55 +228,51 @@ def filter_by_fuzzy_match(
         entities: List of EntityRecord instances
         pattern: Text pattern to match against
         threshold: Minimum similarity score (0-100)
+        memo: Optional memo caching scores per distinct entity text
 
     Returns:
         Filtered list of entities
     """
-    return [
-        entity for entity in entities
-        if fuzz.partial_ratio(entity.text.lower(), pattern.lower()) >= threshold
-    ]
+    matches = _fuzzy_predicate(pattern, threshold, memo)
+    return [entity for entity in entities if matches(entity.text)]
 
 def filter_by_regex(
     entities: EntityList,
-    pattern: str
+    pattern: str,
+    memo: Optional[TextMemo] = None
 ) -> EntityList:
     """Filter entities by regex pattern matching.
 
     Args:
         entities: List of EntityRecord instances
         pattern: Regex pattern to match against
+        memo: Optional memo caching matches per distinct entity text
 
     Returns:
         Filtered list of entities
     """
-    try:
-        regex = re.compile(pattern, re.IGNORECASE)
-        return [
-            entity for entity in entities
-            if regex.search(entity.text)
-        ]
-    except re.error:
+    matches = _regex_predicate(pattern, memo)
+    if matches is None:
         return entities  # Return all entities if regex is invalid
+    return [entity for entity in entities if matches(entity.text)]
 
 def filter_by_partial_word(
     entities: EntityList,
-    word: str
+    word: str,
+    memo: Optional[TextMemo] = None
 ) -> EntityList:
     """Filter entities that contain the given word as a substring.
 
     Args:
         entities: List of EntityRecord instances
         word: Word to search for
+        memo: Optional memo caching matches per distinct entity text
 
     Returns:
         Filtered list of entities
     """
-    word_lower = word.lower()
-    return [
-        entity for entity in entities
-        if word_lower in entity.text.lower()
-    ]
+    matches = _partial_word_predicate(word, memo)
+    return [entity for entity in entities if matches(entity.text)]
 
 def filter_by_length(
     entities: EntityList,
@@ -167,6 +301,9 @@ def filter_all(
 ) -> EntityList:
     """Apply all configured filters to the entities.
 
+    Fuzzy, regex and partial word results are memoized per distinct entity
+    text in ``config.memo``.
+
     Args:
         entities: List of EntityRecord instances
         config: Filter configuration
@@ -189,14 +326,23 @@ def filter_all(
         filtered = filter_by_fuzzy_match(
             filtered,
             config.fuzzy_match,
-            config.fuzzy_threshold
+            config.fuzzy_threshold,
+            config.memo
         )
 
     if config.regex_pattern:
-        filtered = filter_by_regex(filtered, config.regex_pattern)
+        filtered = filter_by_regex(
+            filtered,
+            config.regex_pattern,
+            config.memo
+        )
 
     if config.partial_word:
-        filtered = filter_by_partial_word(filtered, config.partial_word)
+        filtered = filter_by_partial_word(
+            filtered,
+            config.partial_word,
+            config.memo
+        )
 
     if config.min_length is not None or config.max_length is not None:
         filtered = filter_by_length(
@@ -206,3 +352,55 @@ def filter_all(
         )
 
     return filtered
+
+def entity_matcher(config: FilterConfig) -> Callable[[EntityRecord], bool]:
+    """Compile the configured filters into a single-entity predicate.
+
+    Equivalent to ``filter_all([entity], config)``, but the lowercased term
+    sets and text predicates are built once, so testing entities one at a
+    time (e.g. to stop at the first match) costs no more per entity than a
+    ``filter_all`` call over all of them.
+
+    Args:
+        config: Filter configuration
+
+    Returns:
+        Predicate that is True if an entity passes all configured filters
+    """
+    checks: List[Callable[[EntityRecord], bool]] = []
+
+    if config.entity_types:
+        entity_types = config.entity_types
+        checks.append(lambda e: e.label in entity_types)
+
+    if config.blacklist:
+        blacklist_lower = {word.lower() for word in config.blacklist}
+        checks.append(lambda e: e.text.lower() not in blacklist_lower)
+
+    if config.whitelist:
+        whitelist_lower = {word.lower() for word in config.whitelist}
+        checks.append(lambda e: e.text.lower() in whitelist_lower)
+
+    text_predicates: List[TextPredicate] = []
+    if config.fuzzy_match:
+        text_predicates.append(_fuzzy_predicate(
+            config.fuzzy_match, config.fuzzy_threshold, config.memo
+        ))
+    if config.regex_pattern:
+        regex_matches = _regex_predicate(config.regex_pattern, config.memo)
+        if regex_matches is not None:  # Invalid regex keeps all entities
+            text_predicates.append(regex_matches)
+    if config.partial_word:
+        text_predicates.append(
+            _partial_word_predicate(config.partial_word, config.memo)
+        )
+    for predicate in text_predicates:
+        checks.append(lambda e, predicate=predicate: predicate(e.text))
+
+    min_length, max_length = config.min_length, config.max_length
+    if min_length is not None:
+        checks.append(lambda e: len(e.text) >= min_length)
+    if max_length is not None:
+        checks.append(lambda e: len(e.text) <= max_length)
+
+    return lambda entity: all(check(entity) for check in checks)
@@ -0,0 +1,142 @@
+"""Fast language identification for routing documents to models."""
+
+import importlib
+import re
+from typing import Dict, List, Optional, Sequence
+
+# Languages told apart by counting their stop words; all use Latin script
+STOP_WORD_LANGUAGES = (
+    "en", "de", "fr", "es", "it", "pt", "nl", "da", "sv", "nb", "fi", "pl",
+    "ro", "tr", "cs", "hu", "ca"
+)
+
+# Scripts that identify a language on their own, checked after Japanese kana
+SCRIPT_LANGUAGES = [
+    ("ko", re.compile(r"[\uac00-\ud7af]")),  # Hangul
+    ("zh", re.compile(r"[\u4e00-\u9fff]")),  # CJK ideographs
+    ("ru", re.compile(r"[\u0400-\u04ff]")),  # Cyrillic
+    ("el", re.compile(r"[\u0370-\u03ff]")),  # Greek
+    ("ar", re.compile(r"[\u0600-\u06ff]")),  # Arabic
+    ("he", re.compile(r"[\u0590-\u05ff]")),  # Hebrew
+]
+
+KANA = re.compile(r"[\u3040-\u30ff]")  # Hiragana and Katakana
+HAN = SCRIPT_LANGUAGES[1][1]
+LETTERS = re.compile(r"[^\W\d_]")
+WORDS = re.compile(r"[^\W\d_]+")
+
+# Shared identifier used by detect_language, created on first use
+_identifier = None
+
+
+def load_stop_words(languages: Sequence[str]) -> Dict[str, List[str]]:
+    """Index spaCy's stop word lists by word.
+
+    Languages whose stop words are not shipped with spaCy are skipped.
+
+    Args:
+        languages: Language codes to load stop words for
+
+    Returns:
+        Dictionary mapping each stop word to the languages it belongs to
+    """
+    index: Dict[str, List[str]] = {}
+    for language in languages:
+        try:
+            module = importlib.import_module(f"spacy.lang.{language}.stop_words")
+        except ImportError:
+            continue
+        for word in module.STOP_WORDS:
+            index.setdefault(word, []).append(language)
+    return index
+
+class LanguageIdentifier:
+    """Guess the language of a text from its script and stop words.
+
+    Texts mostly written in a distinctive script (CJK, Hangul, Cyrillic,
+    Greek, Arabic, Hebrew) are identified by script; Latin script texts by
+    the language whose stop words occur most often, provided it leads the
+    default language by ``min_hits`` stop words. Only the start of each text
+    is examined, so identification costs little next to NER.
+    """
+
+    def __init__(
+        self,
+        languages: Sequence[str] = STOP_WORD_LANGUAGES,
+        default: str = "en",
+        sample_chars: int = 1000,
+        min_hits: int = 2
+    ):
+        """Create an identifier.
+
+        Args:
+            languages: Latin script languages to tell apart; earlier ones
+                win ties
+            default: Language returned when no language is recognized
+            sample_chars: Number of leading characters examined
+            min_hits: Minimum number of stop words needed to pick a language,
+                and by which it must lead the default language
+        """
+        self.languages = list(languages)
+        self.default = default
+        self.sample_chars = sample_chars
+        self.min_hits = min_hits
+        self.stop_words = load_stop_words(self.languages)
+
+    def detect(self, text: str) -> str:
+        """Identify the language of a text.
+
+        Args:
+            text: Text to identify
+
+        Returns:
+            ISO 639-1 language code, or the default language
+        """
+        sample = text[:self.sample_chars]
+        script = self._detect_script(sample)
+        if script is not None:
+            return script
+
+        scores = dict.fromkeys(self.languages, 0)
+        for word in WORDS.findall(sample.lower()):
+            for language in self.stop_words.get(word, ()):
+                scores[language] += 1
+        best = max(self.languages, key=scores.__getitem__, default=None)
+        if best is None or scores[best] < self.min_hits:
+            return self.default
+        # Short texts share a stop word or two with other languages (e.g.
+        # English "in" and Dutch "met"), so only leave the default language
+        # on clear evidence
+        if scores[best] - scores.get(self.default, 0) < self.min_hits:
+            return self.default
+        return best
+
+    def _detect_script(self, sample: str) -> Optional[str]:
+        """Return the language of the script most of the letters are in."""
+        if sample.isascii():
+            return None
+        letters = len(LETTERS.findall(sample))
+        if not letters:
+            return None
+        kana = len(KANA.findall(sample))
+        # Japanese mixes kana with Chinese characters
+        if kana and (kana + len(HAN.findall(sample))) * 2 > letters:
+            return "ja"
+        for language, script in SCRIPT_LANGUAGES:
+            if len(script.findall(sample)) * 2 > letters:
+                return language
+        return None
+
+def detect_language(text: str) -> str:
+    """Identify the language of a text with the default identifier.
+
+    Args:
+        text: Text to identify
+
+    Returns:
+        ISO 639-1 language code, ``en`` if no language is recognized
+    """
+    global _identifier
+    if _identifier is None:
+        _identifier = LanguageIdentifier()
+    return _identifier.detect(text)
@@ -0,0 +1,123 @@
+"""Lexical prefiltering of text before entity extraction."""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern
+
+from .filters import FilterConfig
+
+# Regex constructs whose meaning depends on the text around an entity, so a
+# match inside the entity text does not imply a match in the document
+CONTEXT_SENSITIVE = re.compile(r"\^|\$|\\[AZbBG]|\(\?<?[=!]")
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """Build a regex alternation with shared prefixes factored out.
+
+    A flat ``a|b|c`` alternation retries every term at every position; a
+    prefix trie keeps the number of alternatives tried per character small
+    even for large term lists.
+
+    Args:
+        terms: Literal terms to match
+
+    Returns:
+        Regex source matching any of the terms
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Marks the end of a term
+
+    def compile_node(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + compile_node(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        optional = "" in node
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if optional else group
+
+    return compile_node(trie)
+
+class Prefilter:
+    """Cheap test for text that may contain an entity passing the filters.
+
+    Every entity text is a substring of the document, so a document can only
+    yield a whitelisted entity if it contains a whitelisted term, and likewise
+    for the partial word and (context-free) regex filters. All configured
+    conditions must hold, mirroring the AND logic of ``filter_all``.
+    """
+
+    def __init__(
+        self,
+        terms: Optional[Iterable[str]] = None,
+        words: Optional[Iterable[str]] = None,
+        patterns: Optional[Iterable[Pattern]] = None
+    ):
+        """Compile the prefilter.
+
+        Args:
+            terms: Terms of which at least one must occur (case-insensitive)
+            words: Substrings that must all occur (case-insensitive)
+            patterns: Compiled regexes that must all match
+        """
+        self.terms_regex: Optional[Pattern] = None
+        if terms is not None:
+            lowered = {term.lower() for term in terms if term}
+            # With no usable terms nothing can match
+            source = _trie_regex(lowered) if lowered else "(?!)"
+            self.terms_regex = re.compile(source)
+        self.words: List[str] = [word.lower() for word in words or ()]
+        self.patterns: List[Pattern] = list(patterns or ())
+
+    def matches(self, text: str) -> bool:
+        """Check whether text may contain a matching entity.
+
+        Args:
+            text: Document, chunk or sentence text
+
+        Returns:
+            False only if no entity in ``text`` can pass the filters
+        """
+        if self.terms_regex is not None or self.words:
+            lowered = text.lower()
+            if not all(word in lowered for word in self.words):
+                return False
+            terms_regex = self.terms_regex
+            if terms_regex is not None and not terms_regex.search(lowered):
+                return False
+        return all(pattern.search(text) for pattern in self.patterns)
+
+def build_prefilter(config: Optional[FilterConfig]) -> Optional[Prefilter]:
+    """Derive a prefilter from a filter configuration.
+
+    Uses the whitelist, the partial word and the regex pattern, skipping
+    regexes that are invalid or depend on context (anchors, word boundaries,
+    lookarounds).
+
+    Args:
+        config: Filter configuration
+
+    Returns:
+        Prefilter, or None if the configuration offers nothing to prefilter on
+    """
+    if config is None:
+        return None
+
+    patterns = []
+    if config.regex_pattern and not CONTEXT_SENSITIVE.search(config.regex_pattern):
+        try:
+            patterns.append(re.compile(config.regex_pattern, re.IGNORECASE))
+        except re.error:
+            pass  # Invalid regex keeps all entities
+
+    words = [config.partial_word] if config.partial_word else []
+    terms = config.whitelist or None
+    if terms is None and not words and not patterns:
+        return None
+    return Prefilter(terms=terms, words=words, patterns=patterns)
@@ -0,0 +1,169 @@
+"""Length-bucketed, token-budgeted batch scheduling for the NER pipeline."""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Rough number of characters per spaCy token, used to estimate batch cost
+CHARS_PER_TOKEN = 4
+
+# A scheduled item: (position in the input window, document text)
+Item = Tuple[int, str]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimate the number of tokens spaCy will produce for text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+def current_rss() -> Optional[int]:
+    """Return the resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` where available and falls back to the peak
+    RSS reported by ``getrusage`` elsewhere.
+
+    Returns:
+        Resident set size in bytes, or None if it cannot be determined
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    try:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError):
+        return None
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+@dataclass
+class BatchStats:
+    """Counters describing the batches a scheduler has produced.
+
+    Attributes:
+        batches: Number of batches run
+        documents: Number of documents processed
+        tokens: Estimated number of tokens processed
+        seconds: Total time spent in the pipeline
+        shrinks: Number of times the token budget was reduced
+    """
+    batches: int = 0
+    documents: int = 0
+    tokens: int = 0
+    seconds: float = 0.0
+    shrinks: int = 0
+
+class AdaptiveBatcher:
+    """Schedule documents into batches sized by a token budget.
+
+    Documents are read in windows, bucketed by (power of two) length so each
+    batch holds documents of similar size, and packed into batches whose
+    estimated token count stays within the budget. After every batch the
+    budget adapts: it shrinks when a batch was slower than ``target_seconds``
+    or RSS exceeded ``max_rss``, and grows slowly after well-filled batches.
+
+    Attributes:
+        token_budget: Current token budget per batch
+        stats: Counters for the batches run so far
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 20000,
+        min_budget: int = 1000,
+        max_budget: int = 500000,
+        target_seconds: float = 2.0,
+        max_rss: Optional[int] = None,
+        window: int = 1000
+    ):
+        """Create a scheduler.
+
+        Args:
+            token_budget: Initial estimated tokens per batch
+            min_budget: Lower bound for the adapted budget
+            max_budget: Upper bound for the adapted budget
+            target_seconds: Batch latency above which the budget shrinks
+            max_rss: RSS in bytes above which the budget shrinks
+            window: Number of documents reordered and bucketed at a time
+        """
+        self.token_budget = token_budget
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.target_seconds = target_seconds
+        self.max_rss = max_rss
+        self.window = window
+        self.stats = BatchStats()
+
+    def batches(self, items: Sequence[Item]) -> Iterator[List[Item]]:
+        """Split a window of documents into length-bucketed batches.
+
+        The budget is read before each batch, so adjustments made through
+        ``observe`` while iterating take effect immediately.
+
+        Args:
+            items: Window of (position, text) items
+
+        Yields:
+            Batches of items; a document larger than the budget gets a
+            batch of its own
+        """
+        buckets = {}
+        for item in items:
+            bucket = estimate_tokens(item[1]).bit_length()
+            buckets.setdefault(bucket, []).append(item)
+
+        for bucket in sorted(buckets):
+            batch: List[Item] = []
+            batch_tokens = 0
+            for item in buckets[bucket]:
+                tokens = estimate_tokens(item[1])
+                if batch and batch_tokens + tokens > self.token_budget:
+                    yield batch
+                    batch, batch_tokens = [], 0
+                batch.append(item)
+                batch_tokens += tokens
+            if batch:
+                yield batch
+
+    def observe(
+        self,
+        documents: int,
+        tokens: int,
+        seconds: float,
+        rss: Optional[int] = None
+    ) -> None:
+        """Record a finished batch and adapt the token budget.
+
+        Args:
+            documents: Number of documents in the batch
+            tokens: Estimated tokens in the batch
+            seconds: Time the pipeline spent on the batch
+            rss: Resident set size in bytes after the batch
+        """
+        stats = self.stats
+        stats.batches += 1
+        stats.documents += documents
+        stats.tokens += tokens
+        stats.seconds += seconds
+
+        if self.max_rss is not None and rss is not None and rss > self.max_rss:
+            budget = self.token_budget // 2
+        elif seconds > self.target_seconds:
+            budget = int(self.token_budget * max(self.target_seconds / seconds, 0.5))
+        elif tokens * 2 >= self.token_budget:
+            # Only grow on batches that actually used the budget
+            budget = int(self.token_budget * 1.25)
+        else:
+            budget = self.token_budget
+        budget = min(max(budget, self.min_budget), self.max_budget)
+        if budget < self.token_budget:
+            stats.shrinks += 1
+        self.token_budget = budget
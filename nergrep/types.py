@@ -1,6 +1,7 @@
 """Type definitions for the nergrep package."""
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -13,9 +14,13 @@ class EntityRecord:
         sentence: The full sentence containing the entity
         start: Character position where the entity starts
         end: Character position where the entity ends
+        source: Input the entity was found in (file path or ``path:line``)
+        canonical_id: ID of the canonical entity the text resolves to
     """
     text: str
     label: str
     sentence: str
     start: int
     end: int
+    source: Optional[str] = None
+    canonical_id: Optional[str] = None
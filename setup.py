@@ -25,6 +25,7 @@ setup(
         "spacy>=3.0.0",
         "typer>=0.9.0",
         "rapidfuzz>=3.0.0",
+        "numpy>=1.23.0",
         "langchain>=0.1.0",
         "openai>=1.0.0",
         "langchain-openai>=0.0.5",
@@ -44,7 +45,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "nergrep=nergrep.cli:app",
+            "nergrep=nergrep.cli:run",
         ],
     },
     python_requires=">=3.8",
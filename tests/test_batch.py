@@ -0,0 +1,90 @@
+"""Tests for columnar entity batches."""
+
+import pytest
+
+from nergrep.batch import EntityBatch, batch_mask, filter_batch
+from nergrep.filters import FilterConfig, filter_all
+from nergrep.types import EntityRecord
+
+
+@pytest.fixture
+def repeated_entities():
+    texts = [
+        ("Apple Inc.", "ORG"),
+        ("Microsoft", "ORG"),
+        ("John Smith", "PERSON"),
+        ("New York", "GPE"),
+        ("Google", "ORG"),
+        ("London", "GPE"),
+    ]
+    return [
+        EntityRecord(
+            text=text,
+            label=label,
+            sentence=f"{text} is mentioned here.",
+            start=i,
+            end=i + len(text)
+        )
+        for i in range(5)
+        for text, label in texts
+    ]
+
+def test_from_records_encodes_distinct_values(repeated_entities):
+    batch = EntityBatch.from_records(repeated_entities)
+    assert len(batch) == 30
+    assert len(batch.texts) == 6
+    assert batch.labels == ["ORG", "PERSON", "GPE"]
+    assert batch.texts_lower[0] == "apple inc."
+    assert batch.lengths.tolist() == [len(e.text) for e in repeated_entities]
+
+def test_empty_batch():
+    assert filter_batch([], FilterConfig(whitelist={"Google"})) == []
+
+@pytest.mark.parametrize("config", [
+    FilterConfig(entity_types={"ORG"}),
+    FilterConfig(blacklist={"microsoft", "NEW YORK"}),
+    FilterConfig(whitelist={"apple inc.", "GOOGLE"}),
+    FilterConfig(fuzzy_match="micro"),
+    FilterConfig(regex_pattern=r"^[A-Z]"),
+    FilterConfig(regex_pattern=r"["),
+    FilterConfig(partial_word="ON"),
+    FilterConfig(min_length=6, max_length=8),
+    FilterConfig(
+        entity_types={"ORG", "GPE"},
+        blacklist={"Google"},
+        partial_word="o",
+        max_length=9
+    ),
+])
+def test_filter_batch_matches_filter_all(repeated_entities, config):
+    assert filter_batch(repeated_entities, config) == filter_all(
+        repeated_entities, config
+    )
+
+def test_batch_mask_preserves_order(repeated_entities):
+    batch = EntityBatch.from_records(repeated_entities)
+    mask = batch_mask(batch, FilterConfig(entity_types={"GPE"}))
+    assert mask.sum() == 10
+    selected = batch.select(mask)
+    assert [e.start for e in selected] == sorted(e.start for e in selected)
+
+def test_batch_mask_evaluates_text_filters_once_per_distinct_text():
+    names = [f"Entity {i}" for i in range(200)]
+    labels = ["ORG", "PERSON", "GPE", "DATE"]
+    entities = [
+        EntityRecord(names[i * 7 % 200], labels[i % 4], "", i, i + 9)
+        for i in range(20000)
+    ]
+    batch = EntityBatch.from_records(entities)
+    config = FilterConfig(entity_types={"ORG"}, regex_pattern="1$")
+    calls = []
+    config.memo.wrap = lambda key, predicate: lambda text: (
+        calls.append(text) or predicate(text)
+    )
+
+    selected = batch.select(batch_mask(batch, config))
+    assert selected == filter_all(entities, FilterConfig(
+        entity_types={"ORG"}, regex_pattern="1$"
+    ))
+    # Only texts of mentions surviving the type filter are tested, once each
+    assert sorted(calls) == sorted({e.text for e in entities if e.label == "ORG"})
@@ -0,0 +1,79 @@
+"""Tests for canonical ID resolution."""
+
+import pytest
+
+from nergrep import canonical
+from nergrep.canonical import CanonicalIndex, normalize, read_aliases
+from nergrep.types import EntityRecord
+
+
+@pytest.fixture
+def index():
+    return CanonicalIndex([
+        ("Apple Inc.", "Q312"),
+        ("Apple", "Q312"),
+        ("Microsoft Corporation", "Q2283"),
+        ("microsoft", "Q2283"),
+        ("Bill Gates", "Q5284"),
+    ])
+
+def test_normalize():
+    assert normalize("  Apple   Inc. ") == "apple inc"
+    assert normalize("AT&T") == "at t"
+    assert normalize("STRASSE") == normalize("straße")
+
+def test_resolve_exact_normalized_and_fuzzy(index):
+    assert index.resolve("Apple Inc.") == "Q312"
+    assert index.resolve("apple inc") == "Q312"
+    assert index.resolve("MICROSOFT") == "Q2283"
+    assert index.resolve("Microsoft Corporatoin") == "Q2283"  # Typo
+    assert index.resolve("Google") is None
+    assert index.resolve("") is None
+
+def test_resolve_without_fuzzy_fallback():
+    index = CanonicalIndex([("Microsoft Corporation", "Q2283")], threshold=None)
+    assert index.resolve("microsoft corporation") == "Q2283"
+    assert index.resolve("Microsoft Corporatoin") is None
+
+def test_fuzzy_candidates_are_blocked(monkeypatch):
+    monkeypatch.setattr(canonical, "MAX_BLOCK_SIZE", 5)
+    aliases = [(f"Company {i} Inc", f"Q{i}") for i in range(100)]
+    aliases.append(("Microsoft Corporation", "Q2283"))
+    index = CanonicalIndex(aliases)
+
+    # Only aliases sharing a rare token or token prefix are scored
+    assert index._candidates("microsoft corporatoin") == ["microsoft corporation"]
+    assert index._candidates("company 7 inx") == ["company 7 inc"]
+    assert index.resolve("Microsoft Corporatoin") == "Q2283"
+    assert index.resolve("Microsfot Corporation") == "Q2283"
+    # Candidates too short or long to reach the threshold are skipped
+    assert index._candidates("microsoft") == []
+
+def test_first_alias_wins():
+    index = CanonicalIndex([("Paris", "Q90"), ("paris", "Q167646")])
+    assert index.resolve("Paris") == "Q90"
+    assert index.resolve("paris") == "Q167646"
+    assert index.resolve("PARIS") == "Q90"
+
+def test_resolutions_are_memoized(index):
+    for _ in range(3):
+        index.resolve("Apple Inc")
+    assert (index.memo.misses, index.memo.hits) == (1, 2)
+
+def test_canonicalize_sets_ids(index):
+    entities = [
+        EntityRecord("Apple", "ORG", "", 0, 5),
+        EntityRecord("London", "GPE", "", 10, 16),
+    ]
+    index.canonicalize(entities)
+    assert [e.canonical_id for e in entities] == ["Q312", None]
+
+def test_read_aliases(tmp_path):
+    tsv = tmp_path / "aliases.tsv"
+    tsv.write_text("# alias\tid\nApple Inc.\tQ312\n\nApple, Inc\tQ312\n")
+    assert read_aliases(str(tsv)) == [("Apple Inc.", "Q312"), ("Apple, Inc", "Q312")]
+
+    table = tmp_path / "aliases.csv"
+    table.write_text('"Apple, Inc",Q312\nbroken\n')
+    with pytest.raises(ValueError):
+        read_aliases(str(table))
@@ -0,0 +1,58 @@
+"""Tests for job checkpoints."""
+
+from nergrep.checkpoint import Checkpoint
+from nergrep.documents import iter_documents
+
+
+def test_load_missing_checkpoint(tmp_path):
+    checkpoint = Checkpoint.load(str(tmp_path / "missing.json"))
+    assert checkpoint == Checkpoint()
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "job.checkpoint")
+    checkpoint = Checkpoint(
+        inputs=["corpus/"],
+        output_bytes=1234,
+        documents=3,
+        cursors={0: ("corpus/b.jsonl", 512, 7), 1: ("(text)#1", None, None)}
+    )
+    checkpoint.save(path)
+    assert Checkpoint.load(path) == checkpoint
+    assert not (tmp_path / "job.checkpoint.tmp").exists()
+
+def test_resume_skips_recorded_documents(tmp_path):
+    (tmp_path / "a.txt").write_text("Whole file document.")
+    lines = tmp_path / "b.txt"
+    lines.write_text("First line.\nSecond line.\n\nThird line.\n")
+    inputs = [str(tmp_path / "a.txt"), str(lines), "Literal text."]
+
+    checkpoint = Checkpoint(inputs=inputs)
+    for document in iter_documents(inputs, lines=True):
+        checkpoint.record(document)
+        if document.text == "Second line.":
+            break
+
+    resumed = iter_documents(inputs, lines=True, cursors=checkpoint.cursors)
+    assert [(d.source, d.text) for d in resumed] == [
+        (f"{lines}:4", "Third line."),
+        ("(text)", "Literal text.")
+    ]
+    assert checkpoint.documents == 3
+
+def test_resume_directory_from_cursor(tmp_path):
+    corpus = tmp_path / "corpus"
+    (corpus / "sub").mkdir(parents=True)
+    for name in ["a.txt", "b.txt", "sub/c.txt", "sub/d.txt"]:
+        (corpus / name).write_text(f"Document {name}")
+    inputs = [str(corpus), "Literal text."]
+
+    checkpoint = Checkpoint(inputs=inputs)
+    for document in iter_documents(inputs):
+        checkpoint.record(document)
+        if document.source.endswith("c.txt"):
+            break
+
+    # One cursor per input argument, not one entry per finished file
+    assert checkpoint.cursors == {0: (str(corpus / "sub" / "c.txt"), None, None)}
+    resumed = iter_documents(inputs, cursors=checkpoint.cursors)
+    assert [d.text for d in resumed] == ["Document sub/d.txt", "Literal text."]
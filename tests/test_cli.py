@@ -0,0 +1,204 @@
+"""Tests for the command-line interface."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nergrep import cli
+from nergrep.cli import print_entities
+from nergrep.types import EntityRecord
+
+
+def test_print_entities_json_streams_array():
+    stream = io.StringIO()
+    written = []
+
+    def entities():
+        for i in range(3):
+            # Earlier elements are written before later ones are produced
+            written.append(stream.getvalue().count('"text"'))
+            yield EntityRecord(f"Entity {i}", "ORG", "Sentence.", i, i + 8)
+
+    print_entities(entities(), "json", include_sentence=False, stream=stream)
+    assert written == [0, 1, 2]
+    data = json.loads(stream.getvalue())
+    assert [item["text"] for item in data] == ["Entity 0", "Entity 1", "Entity 2"]
+    assert all(item["sentence"] == "" for item in data)
+
+def test_print_entities_json_empty():
+    stream = io.StringIO()
+    print_entities([], "json", stream=stream)
+    assert stream.getvalue() == "[]\n"
+
+NAMES = {"Apple": "ORG", "Google": "ORG", "London": "GPE"}
+
+
+def fake_iter_entities(text, types=None, **kwargs):
+    """Yield a record for each known name in a text, in order."""
+    for word in text.replace(".", " ").split():
+        label = NAMES.get(word)
+        if label is not None and (not types or label in types):
+            start = text.index(word)
+            yield EntityRecord(word, label, text, start, start + len(word))
+
+@pytest.fixture
+def inputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "iter_entities", fake_iter_entities)
+    (tmp_path / "a.txt").write_text("Apple and Google. Apple in London.")
+    (tmp_path / "b.txt").write_text("Nothing to see here.")
+    (tmp_path / "c.txt").write_text("Google opened in London.")
+    return [str(tmp_path / name) for name in ("a.txt", "b.txt", "c.txt")]
+
+def test_files_with_matches(inputs):
+    result = CliRunner().invoke(cli.app, ["-l", "-t", "ORG", *inputs])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [inputs[0], inputs[2]]
+
+def test_count(inputs):
+    result = CliRunner().invoke(cli.app, ["-c", "-t", "ORG", *inputs])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"{inputs[0]}:3", f"{inputs[1]}:0", f"{inputs[2]}:1"
+    ]
+
+def test_count_applies_filters(inputs):
+    result = CliRunner().invoke(cli.app, ["-c", "-r", "^[GL]", *inputs])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"{inputs[0]}:2", f"{inputs[1]}:0", f"{inputs[2]}:2"
+    ]
+
+def test_max_count_caps_matches_per_input(inputs):
+    result = CliRunner().invoke(
+        cli.app, ["-m", "2", "-o", "json", inputs[0], inputs[2]]
+    )
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert [(item["text"], item["source"]) for item in data] == [
+        ("Apple", inputs[0]),
+        ("Google", inputs[0]),
+        ("Google", inputs[2]),
+        ("London", inputs[2]),
+    ]
+
+def test_files_with_matches_rejects_count(inputs):
+    result = CliRunner().invoke(cli.app, ["-l", "-c", *inputs])
+    assert result.exit_code != 0
+    assert "--files-with-matches" in result.output
+
+def test_window_rejects_negative(inputs):
+    result = CliRunner().invoke(cli.app, ["-r", "Apple", "--window", "-1", *inputs])
+    assert result.exit_code != 0
+    assert "--window" in result.output
+
+def test_batch_tokens_with_prefilter_and_count(inputs, monkeypatch):
+    batched = []
+
+    def fake_extract_many(texts, types, batcher):
+        for text in texts:
+            batched.append(text)
+            yield list(fake_iter_entities(text, types))
+
+    monkeypatch.setattr(cli, "extract_many", fake_extract_many)
+    result = CliRunner().invoke(
+        cli.app, ["-c", "-p", "London", "--batch-tokens", "1000", *inputs]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"{inputs[0]}:1", f"{inputs[1]}:0", f"{inputs[2]}:1"
+    ]
+    # The prefilter rejects the second input before batching
+    assert len(batched) == 2
+
+def test_batch_tokens_rejects_cascade(inputs):
+    result = CliRunner().invoke(
+        cli.app, ["--batch-tokens", "1000", "--cascade", *inputs]
+    )
+    assert result.exit_code != 0
+    assert "--batch-tokens" in result.output
+
+@pytest.fixture
+def shard_outputs(inputs, tmp_path_factory):
+    """Run each of two shards over the inputs, returning a runner of both."""
+    out_dir = tmp_path_factory.mktemp("shards")
+
+    def run_shards(*options):
+        paths = []
+        for shard in ("1/2", "2/2"):
+            path = out_dir / f"{shard.replace('/', 'of')}.out"
+            result = CliRunner().invoke(cli.app, [
+                *options, "--shard", shard, "--output-file", str(path), *inputs
+            ])
+            assert result.exit_code == 0, result.output
+            paths.append(str(path))
+        return paths
+
+    return run_shards
+
+def test_merge_entities_matches_unsharded_run(inputs, shard_outputs):
+    unsharded = CliRunner().invoke(cli.app, ["-o", "jsonl", *inputs])
+    merged = CliRunner().invoke(
+        cli.merge_app, ["-o", "jsonl", *shard_outputs("-o", "jsonl")]
+    )
+    assert merged.exit_code == 0, merged.output
+    assert merged.output == unsharded.output
+
+def test_merge_counts_matches_unsharded_run(inputs, shard_outputs):
+    unsharded = CliRunner().invoke(cli.app, ["-c", *inputs])
+    merged = CliRunner().invoke(
+        cli.merge_app, ["-k", "counts", *shard_outputs("-c")]
+    )
+    assert merged.exit_code == 0, merged.output
+    assert merged.output == unsharded.output
+
+def test_merge_reports_malformed_input(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    Path("counts.txt").write_text("a.txt:2\nb.txt:two\n")
+    result = CliRunner().invoke(cli.merge_app, ["-k", "counts", "counts.txt"])
+    assert result.exit_code != 0
+    assert "counts.txt:2: invalid count 'two'" in result.output
+
+    record = EntityRecord("Apple", "ORG", "Apple.", 0, 5)
+    Path("entities.jsonl").write_text(
+        json.dumps(cli.entity_to_dict(record)) + '\n{"text": \n'
+    )
+    result = CliRunner().invoke(cli.merge_app, ["entities.jsonl"])
+    assert result.exit_code != 0
+    assert "entities.jsonl:2: Expecting value" in result.output
+
+def test_merge_rejects_unknown_kind(tmp_path):
+    result = CliRunner().invoke(cli.merge_app, ["-k", "sums", str(tmp_path)])
+    assert result.exit_code != 0
+    assert "--kind" in result.output
+
+def test_run_dispatches_merge(tmp_path, monkeypatch, capsys):
+    counts = tmp_path / "counts.txt"
+    counts.write_text("a.txt:2\nb.txt:1\na.txt:3\n")
+    monkeypatch.setattr(sys, "argv", ["nergrep", "merge", "-k", "counts", str(counts)])
+    with pytest.raises(SystemExit) as exit_info:
+        cli.run()
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().out == "a.txt:5\nb.txt:1\n"
+
+def test_sort_buffer_must_be_positive(inputs):
+    result = CliRunner().invoke(cli.app, ["-s", "text", "--sort-buffer", "0", *inputs])
+    assert result.exit_code != 0
+    assert "--sort-buffer" in result.output
+
+def test_cascade_reports_prefiltered_chunks(inputs, monkeypatch):
+    def fake_cascade(text, stats=None, **kwargs):
+        # Two candidate paragraphs per input, one escalated
+        stats.units += 2
+        stats.escalated += 1
+        return fake_iter_entities(text)
+
+    monkeypatch.setattr(cli, "iter_entities", fake_cascade)
+    result = CliRunner().invoke(
+        cli.app, ["--cascade", "--escalate-documents", "-p", "London", *inputs]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Escalated 2 of 4 candidate chunks (50.0%)" in result.output
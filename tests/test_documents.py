@@ -0,0 +1,96 @@
+"""Tests for input document discovery."""
+
+import os
+
+import pytest
+
+from nergrep.documents import (
+    LITERAL_SOURCE,
+    as_path,
+    iter_documents,
+    parse_shard,
+    shard_of,
+)
+
+
+def test_iter_documents_literal_text():
+    documents = list(iter_documents(["Apple Inc. is a company."]))
+    assert len(documents) == 1
+    assert documents[0].source == LITERAL_SOURCE
+    assert documents[0].text == "Apple Inc. is a company."
+
+def test_iter_documents_long_literal_text():
+    text = "Microsoft " * 100
+    assert as_path(text) is None
+    assert [d.text for d in iter_documents([text])] == [text]
+
+def test_iter_documents_files_and_directories(tmp_path):
+    (tmp_path / "b.txt").write_text("second")
+    (tmp_path / "a.txt").write_text("first")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.txt").write_text("third")
+    single = tmp_path / "a.txt"
+
+    documents = list(iter_documents([str(single), str(tmp_path)]))
+    assert [d.text for d in documents] == ["first", "first", "second", "third"]
+    assert documents[0].source == str(single)
+    assert documents[3].source == str(tmp_path / "sub" / "c.txt")
+
+def test_iter_documents_lines(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("First document.\n\nSecond document.\n")
+    documents = list(iter_documents([str(corpus)], lines=True))
+    assert [(d.source, d.text) for d in documents] == [
+        (f"{corpus}:1", "First document."),
+        (f"{corpus}:3", "Second document.")
+    ]
+
+def test_iter_documents_jsonl_field(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text('{"id": 1, "body": "Apple Inc."}\n{"id": 2}\n')
+    documents = list(iter_documents([str(corpus)], jsonl_field="body"))
+    assert [d.text for d in documents] == ["Apple Inc.", ""]
+
+def test_parse_shard():
+    assert parse_shard("2/8") == (2, 8)
+    for value in ["0/4", "5/4", "1/0", "x/4", "1", "1/2/3"]:
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+def test_shard_of_is_deterministic_and_in_range():
+    keys = [f"corpus/file{i}.txt" for i in range(200)]
+    assignments = [shard_of(key, 4) for key in keys]
+    assert assignments == [shard_of(key, 4) for key in keys]
+    assert set(assignments) == {1, 2, 3, 4}
+    assert shard_of("corpus/file0.txt", 1) == 1
+
+def test_iter_documents_shards_partition_inputs(tmp_path):
+    for i in range(20):
+        (tmp_path / f"doc{i:02d}.txt").write_text(f"Document {i}")
+    everything = [d.source for d in iter_documents([str(tmp_path)])]
+    sharded = [
+        d.source
+        for k in range(1, 4)
+        for d in iter_documents([str(tmp_path)], shard=(k, 3))
+    ]
+    assert sorted(sharded) == everything
+
+def test_shards_do_not_depend_on_path_spelling(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus"
+    (corpus / "sub").mkdir(parents=True)
+    for i in range(30):
+        (corpus / ("sub" if i % 2 else ".") / f"doc{i:02d}.txt").write_text(
+            f"Document {i}\nSecond line {i}"
+        )
+    monkeypatch.chdir(tmp_path)
+
+    def shard_texts(inputs, **options):
+        return [
+            sorted(d.text for d in iter_documents(inputs, shard=(k, 3), **options))
+            for k in range(1, 4)
+        ]
+
+    for options in [{}, {"lines": True}]:
+        relative = shard_texts(["corpus"], **options)
+        assert relative == shard_texts([str(corpus)], **options)
+        assert relative == shard_texts([f".{os.sep}corpus{os.sep}"], **options)
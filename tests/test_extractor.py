@@ -1,6 +1,25 @@
 """Tests for the entity extractor."""
 
-from nergrep.extractor import extract_entities
+from collections import Counter
+
+import pytest
+
+from nergrep import extractor
+from nergrep.extractor import (
+    DEFAULT_MODEL,
+    CascadeConfig,
+    CascadeStats,
+    ModelPool,
+    extract_entities,
+    extract_entities_cascade,
+    extract_many,
+    extract_multilingual,
+    iter_chunks,
+    iter_entities,
+    iter_windows,
+    parse_model_map,
+)
+from nergrep.scheduler import AdaptiveBatcher
 
 
 def test_extract_entities_basic():
@@ -46,3 +65,153 @@ def test_extract_entities_with_position():
     microsoft_entity = next(e for e in entities if e.text == "Microsoft")
     assert microsoft_entity.start == 15  # Account for "and " after "Apple Inc."
     assert microsoft_entity.end == 24  # 15 + len("Microsoft")
+
+def test_iter_chunks_splits_at_paragraphs():
+    text = "First paragraph.\n\nSecond paragraph.\n\nThird."
+    chunks = list(iter_chunks(text, max_chars=10))
+    assert [chunk for _, chunk in chunks] == [
+        "First paragraph.\n\n",
+        "Second paragraph.\n\n",
+        "Third."
+    ]
+    assert all(text[offset:offset + len(chunk)] == chunk for offset, chunk in chunks)
+    assert list(iter_chunks(text)) == [(0, text)]
+
+def test_iter_entities_matches_positions():
+    text = "Apple Inc. is a technology company.\n\nMicrosoft is their competitor."
+    entities = list(iter_entities(text, chunk_chars=1))
+
+    microsoft_entity = next(e for e in entities if e.text == "Microsoft")
+    assert text[microsoft_entity.start:microsoft_entity.end] == "Microsoft"
+    assert microsoft_entity.sentence == "Microsoft is their competitor."
+
+def test_iter_windows_merges_neighbours():
+    text = "One. Two. Three. Four. Five. Six."
+    assert list(iter_windows(text, lambda s: s in {"Two.", "Four."}, 0)) == [
+        (5, "Two."),
+        (17, "Four.")
+    ]
+    assert list(iter_windows(text, lambda s: s in {"Two.", "Four."}, 1)) == [
+        (0, "One. Two. Three. Four. Five.")
+    ]
+    assert list(iter_windows(text, lambda s: False)) == []
+
+def test_iter_windows_rejects_negative_neighbours():
+    with pytest.raises(ValueError):
+        list(iter_windows("One. Two.", neighbours=-1))
+
+def test_iter_entities_with_sentence_window():
+    text = (
+        "The weather was mild. Apple Inc. is a technology company. "
+        "Microsoft is their competitor. Nothing else happened."
+    )
+    entities = list(iter_entities(
+        text, candidate=lambda s: "Microsoft" in s, window=0
+    ))
+    assert [e.text for e in entities] == ["Microsoft"]
+    assert text[entities[0].start:entities[0].end] == "Microsoft"
+
+def test_extract_entities_cascade_escalation_rules():
+    text = "Apple Inc. is a technology company. Microsoft is their competitor."
+    stats = CascadeStats()
+    cascade = CascadeConfig(
+        fast_model=DEFAULT_MODEL,
+        uncertain_labels=set(),
+        candidate=lambda s: "Microsoft" in s
+    )
+    entities = extract_entities_cascade(text, cascade=cascade, stats=stats)
+
+    assert stats.units == 2
+    assert stats.escalated == 1
+    assert stats.escalation_rate == 0.5
+    assert {e.text for e in entities} == {
+        e.text for e in extract_entities(text)
+    }
+    microsoft_entity = next(e for e in entities if e.text == "Microsoft")
+    assert text[microsoft_entity.start:microsoft_entity.end] == "Microsoft"
+
+def test_extract_entities_cascade_per_document():
+    text = "Apple Inc. is a technology company. Microsoft is their competitor."
+    stats = CascadeStats()
+    cascade = CascadeConfig(
+        fast_model=DEFAULT_MODEL,
+        escalate_types={"ORG"},
+        per_sentence=False
+    )
+    entities = extract_entities_cascade(
+        text, types={"ORG"}, cascade=cascade, stats=stats
+    )
+
+    assert (stats.units, stats.escalated) == (1, 1)
+    assert all(e.label == "ORG" for e in entities)
+
+def test_extract_many_preserves_order():
+    texts = [
+        "Microsoft is a company.",
+        "Apple Inc. is a technology company. " * 20,
+        "No entities here.",
+        "Apple Inc. and Microsoft are tech companies."
+    ]
+    batcher = AdaptiveBatcher(token_budget=50, min_budget=1, window=3)
+    results = list(extract_many(texts, batcher=batcher))
+
+    assert len(results) == len(texts)
+    for text, entities in zip(texts, results):
+        assert [(e.text, e.start) for e in entities] == [
+            (e.text, e.start) for e in extract_entities(text)
+        ]
+    assert batcher.stats.documents == len(texts)
+
+def test_extract_multilingual_routes_and_preserves_order():
+    texts = [
+        "Microsoft is a company and Bill Gates founded it.",
+        "Die Firma Microsoft wurde von Bill Gates in Amerika gegründet.",
+        "Apple Inc. and Microsoft are tech companies.",
+    ]
+    languages = Counter()
+    batcher = AdaptiveBatcher(window=2)
+    results = list(extract_multilingual(
+        texts, batcher=batcher, models={"de": DEFAULT_MODEL}, languages=languages
+    ))
+
+    assert languages == Counter({"en": 2, "de": 1})
+    for text, entities in zip(texts, results):
+        assert [(e.text, e.start) for e in entities] == [
+            (e.text, e.start) for e in extract_entities(text)
+        ]
+
+def test_model_pool_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(extractor, "_load", lambda name: (name, None))
+    pool = ModelPool(max_models=2, pinned=["pinned"])
+
+    assert pool.get("pinned") == ("pinned", None)
+    pool.get("a")
+    pool.get("b")
+    pool.get("a")
+    pool.get("c")  # Evicts b, the least recently used
+
+    assert "a" in pool and "c" in pool and "pinned" in pool
+    assert "b" not in pool
+    assert (pool.loads, pool.evictions) == (4, 1)
+
+def test_model_pool_evicts_idle_models(monkeypatch):
+    monkeypatch.setattr(extractor, "_load", lambda name: (name, None))
+    pool = ModelPool(max_idle=60, pinned=["pinned"])
+    pool.get("pinned")
+    pool.get("a")
+
+    pool.evict_idle(now=1e12)
+    assert "a" not in pool
+    assert "pinned" in pool
+
+def test_model_pool_rejects_empty_size():
+    with pytest.raises(ValueError):
+        ModelPool(max_models=0)
+
+def test_parse_model_map():
+    assert parse_model_map("de=de_core_news_sm, fr=fr_core_news_md") == {
+        "de": "de_core_news_sm",
+        "fr": "fr_core_news_md"
+    }
+    with pytest.raises(ValueError):
+        parse_model_map("de")
@@ -0,0 +1,78 @@
+"""Tests for external-memory sorting."""
+
+import os
+from collections import Counter
+
+import pytest
+
+from nergrep import extsort
+from nergrep.extsort import ExternalSorter, external_sort, frequency_key, sort_key
+from nergrep.types import EntityRecord
+
+
+@pytest.fixture
+def mentions():
+    names = [
+        ("Microsoft", "ORG"), ("apple", "ORG"), ("Apple", "ORG"),
+        ("London", "GPE"), ("Bill Gates", "PERSON"), ("Microsoft", "ORG"),
+        ("Paris", "GPE"), ("Microsoft", "ORG"), ("London", "GPE"),
+    ]
+    return [
+        EntityRecord(
+            text=text,
+            label=label,
+            sentence=f"Sentence {i} mentions {text}.",
+            start=(i * 7) % 5,
+            end=(i * 7) % 5 + len(text),
+            source=f"doc.txt:{i % 3 + 1}"
+        )
+        for i, (text, label) in enumerate(names * 3)
+    ]
+
+def expected_order(mentions, sort_by):
+    counts = Counter(frequency_key(m) for m in mentions)
+    return sorted(mentions, key=sort_key(sort_by, counts))
+
+@pytest.mark.parametrize("sort_by", [
+    "text", "label", "position", "length", "frequency", "source"
+])
+@pytest.mark.parametrize("buffer_size", [1, 4, 1000])
+def test_external_sort_matches_list_sort(mentions, sort_by, buffer_size, tmp_path):
+    result = list(external_sort(mentions, sort_by, buffer_size, str(tmp_path)))
+    assert result == expected_order(mentions, sort_by)
+    # Temporary runs are cleaned up
+    assert os.listdir(tmp_path) == []
+
+def test_external_sort_multi_level_merge(mentions, monkeypatch, tmp_path):
+    monkeypatch.setattr(extsort, "MAX_FAN_IN", 3)
+    with ExternalSorter("text", buffer_size=2, tmp_dir=str(tmp_path)) as sorter:
+        sorter.add(mentions)
+        assert list(sorter) == expected_order(mentions, "text")
+        assert sorter.runs > len(mentions) // 2
+
+def test_then_by_source_breaks_ties():
+    a = EntityRecord("Apple", "ORG", "", 5, 10, "b.txt")
+    b = EntityRecord("Apple", "ORG", "", 0, 5, "a.txt:10")
+    c = EntityRecord("Apple", "ORG", "", 0, 5, "a.txt:9")
+    result = list(external_sort([a, b, c], "text", 1, then_by_source=True))
+    assert result == [c, b, a]
+
+def test_unknown_sort_key():
+    with pytest.raises(ValueError):
+        ExternalSorter("color")
+
+def test_buffer_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ExternalSorter("text", buffer_size=0)
+
+def test_frequency_groups_by_canonical_id():
+    names = ["Apple", "Apple Inc.", "apple inc", "Microsoft", "Microsoft"]
+    records = [
+        EntityRecord(text, "ORG", "", i, i + len(text)) for i, text in enumerate(names)
+    ]
+    for record in records[:3]:
+        record.canonical_id = "Q312"
+
+    result = list(external_sort(records, "frequency", buffer_size=2))
+    assert [r.canonical_id for r in result] == ["Q312"] * 3 + [None] * 2
+    assert {frequency_key(r) for r in records[:3]} == {("Q312", "")}
@@ -4,6 +4,8 @@ import pytest
 
 from nergrep.filters import (
     FilterConfig,
+    TextMemo,
+    entity_matcher,
     filter_all,
     filter_by_blacklist,
     filter_by_fuzzy_match,
@@ -169,3 +171,52 @@ def test_filter_all_with_blacklist_and_whitelist(sample_entities):
     filtered = filter_all(sample_entities, config)
     assert len(filtered) == 1
     assert filtered[0].text == "Apple Inc."
+
+def test_text_memo_lru_eviction():
+    memo = TextMemo(maxsize=2)
+    calls = []
+    predicate = memo.wrap("len", lambda text: calls.append(text) or len(text) > 3)
+
+    assert predicate("Apple") is True
+    assert predicate("IBM") is False
+    assert predicate("Apple") is True  # Hit, refreshes "Apple"
+    assert predicate("Google") is True  # Evicts "IBM"
+    assert predicate("IBM") is False
+
+    assert calls == ["Apple", "IBM", "Google", "IBM"]
+    assert len(memo) == 2
+    assert memo.hits == 1
+    assert memo.misses == 4
+    assert memo.evictions == 2
+    assert memo.hit_rate == pytest.approx(0.2)
+
+def test_filter_all_memoizes_per_distinct_text(sample_entities):
+    config = FilterConfig(fuzzy_match="micro", partial_word="o")
+    repeated = sample_entities * 10
+
+    first = filter_all(repeated, config)
+    assert [e.text for e in first] == ["Microsoft"] * 10
+    assert config.memo.misses == len(sample_entities) + 1
+    assert config.memo.hit_rate > 0.8
+
+    # Changing a parameter must not reuse stale results
+    config.fuzzy_match = "goog"
+    assert {e.text for e in filter_all(repeated, config)} == {"Google"}
+
+def test_filter_functions_accept_memo(sample_entities):
+    memo = TextMemo()
+    assert len(filter_by_regex(sample_entities, r"soft$", memo)) == 1
+    assert len(filter_by_regex(sample_entities, r"soft$", memo)) == 1
+    assert memo.hits == len(sample_entities)
+
+@pytest.mark.parametrize("config", [
+    FilterConfig(entity_types={"ORG"}),
+    FilterConfig(blacklist={"microsoft"}, whitelist={"Microsoft", "Google"}),
+    FilterConfig(fuzzy_match="jon smith", fuzzy_threshold=70),
+    FilterConfig(regex_pattern=r"^[A-Z][a-z]+$", min_length=6),
+    FilterConfig(regex_pattern=r"(", partial_word="o", max_length=8),
+])
+def test_entity_matcher_agrees_with_filter_all(sample_entities, config):
+    matcher = entity_matcher(config)
+    expected = filter_all(sample_entities, config)
+    assert [e for e in sample_entities if matcher(e)] == expected
@@ -0,0 +1,42 @@
+"""Tests for language identification."""
+
+from nergrep.langid import LanguageIdentifier, detect_language
+
+
+def test_detect_latin_script_languages():
+    identifier = LanguageIdentifier()
+    texts = {
+        "en": "Apple Inc. was founded by Steve Jobs in California.",
+        "de": "Die Regierung hat am Montag in Berlin einen neuen Plan vorgestellt.",
+        "fr": "Le président de la République a annoncé hier une nouvelle réforme.",
+        "es": "El presidente anunció ayer que la economía crece.",
+        "nl": "De regering heeft gisteren in Den Haag een nieuw plan gepresenteerd.",
+    }
+    for language, text in texts.items():
+        assert identifier.detect(text) == language
+
+def test_detect_short_default_language_text():
+    identifier = LanguageIdentifier()
+    # "met" is a Dutch stop word and "in" is English and Dutch
+    assert identifier.detect("Microsoft 0 met Bill Gates. Apple in London 0.") == "en"
+    assert identifier.detect("Der Vorstand von Siemens tagte in München.") == "de"
+
+def test_detect_by_script():
+    assert detect_language("Президент встретился с министром.") == "ru"
+    assert detect_language("北京是中国的首都。") == "zh"
+    assert detect_language("東京で会議が開かれました。") == "ja"
+    assert detect_language("서울은 한국의 수도입니다.") == "ko"
+
+def test_detect_falls_back_to_default():
+    identifier = LanguageIdentifier(default="xx")
+    assert identifier.detect("Microsoft") == "xx"
+    assert identifier.detect("") == "xx"
+    assert identifier.detect("12345") == "xx"
+
+def test_detect_restricted_languages():
+    identifier = LanguageIdentifier(languages=["en", "de"])
+    assert identifier.detect("Die Firma wurde von ihm in Amerika gegründet.") == "de"
+    assert all(
+        set(languages) <= {"en", "de"}
+        for languages in identifier.stop_words.values()
+    )
@@ -0,0 +1,53 @@
+"""Tests for the lexical prefilter."""
+
+import re
+
+import pytest
+
+from nergrep.filters import FilterConfig
+from nergrep.prefilter import Prefilter, _trie_regex, build_prefilter
+
+
+def test_trie_regex_matches_all_terms():
+    terms = ["apple", "apple inc.", "app", "microsoft", "a+b"]
+    regex = re.compile(_trie_regex(terms))
+    for term in terms:
+        assert regex.fullmatch(term)
+    assert not regex.fullmatch("ap")
+    assert not regex.search("google")
+
+def test_prefilter_whitelist_terms():
+    prefilter = Prefilter(terms={"Apple Inc.", "Bill Gates"})
+    assert prefilter.matches("Shares of APPLE INC. rose.")
+    assert prefilter.matches("bill gates spoke.")
+    assert not prefilter.matches("Microsoft and Google.")
+
+def test_prefilter_empty_whitelist_never_matches():
+    assert not Prefilter(terms={""}).matches("Anything at all.")
+
+def test_prefilter_requires_all_conditions():
+    prefilter = Prefilter(
+        terms={"Microsoft"},
+        words=["soft"],
+        patterns=[re.compile("corp", re.IGNORECASE)]
+    )
+    assert prefilter.matches("Microsoft Corporation")
+    assert not prefilter.matches("Microsoft")
+
+def test_build_prefilter_without_lexical_filters():
+    assert build_prefilter(None) is None
+    assert build_prefilter(FilterConfig(entity_types={"ORG"})) is None
+    assert build_prefilter(FilterConfig(fuzzy_match="micro")) is None
+
+@pytest.mark.parametrize("pattern", [r"^[A-Z]", r"soft$", r"\bsoft", r"(?<=x)y", r"["])
+def test_build_prefilter_skips_unsafe_regex(pattern):
+    assert build_prefilter(FilterConfig(regex_pattern=pattern)) is None
+
+def test_build_prefilter_from_config():
+    prefilter = build_prefilter(FilterConfig(
+        whitelist={"Microsoft"},
+        partial_word="SOFT",
+        regex_pattern=r"micro\w+"
+    ))
+    assert prefilter.matches("She joined microsoft last year.")
+    assert not prefilter.matches("She joined Google last year.")
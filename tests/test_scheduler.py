@@ -0,0 +1,49 @@
+"""Tests for the adaptive batch scheduler."""
+
+from nergrep.scheduler import AdaptiveBatcher, current_rss, estimate_tokens
+
+
+def test_batches_respect_budget_and_bucket_by_length():
+    texts = ["short"] * 6 + ["x" * 400] * 3 + ["y" * 4000]
+    batcher = AdaptiveBatcher(token_budget=250, min_budget=1)
+    batches = list(batcher.batches(list(enumerate(texts))))
+
+    # Every item is scheduled exactly once
+    assert sorted(i for batch in batches for i, _ in batch) == list(range(10))
+    for batch in batches:
+        # Each batch holds documents from a single length bucket
+        assert len({estimate_tokens(t).bit_length() for _, t in batch}) == 1
+        # Only an oversized document may exceed the budget, alone
+        assert (
+            sum(estimate_tokens(t) for _, t in batch) <= 250 or len(batch) == 1
+        )
+
+def test_observe_adapts_budget():
+    batcher = AdaptiveBatcher(
+        token_budget=1000,
+        min_budget=100,
+        max_budget=2000,
+        target_seconds=1.0,
+        max_rss=1000
+    )
+    batcher.observe(10, 1000, 0.1, rss=10)
+    assert batcher.token_budget == 1250
+
+    batcher.observe(10, 100, 0.1, rss=10)  # Underfilled batch: no growth
+    assert batcher.token_budget == 1250
+
+    batcher.observe(10, 1250, 2.0, rss=10)  # Too slow
+    assert batcher.token_budget == 625
+
+    batcher.observe(10, 625, 0.1, rss=5000)  # Too much memory
+    assert batcher.token_budget == 312
+
+    for _ in range(10):
+        batcher.observe(1, 1, 0.1, rss=5000)
+    assert batcher.token_budget == 100
+    assert batcher.stats.batches == 14
+    assert batcher.stats.shrinks >= 3
+
+def test_current_rss():
+    rss = current_rss()
+    assert rss is None or rss > 0